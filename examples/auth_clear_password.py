@@ -1,3 +1,4 @@
+import hmac
 import logging
 import asyncio
 
@@ -18,12 +19,28 @@ USERS = {
     "user2": "password2",
 }
 
+# Compared against when a user doesn't exist, so unknown users take as long to reject as bad passwords
+_DUMMY_PASSWORD = b"\x00" * 32
+
 
 class CustomAuthPlugin(AbstractClearPasswordAuthPlugin):
     name = "custom_plugin"
 
     async def check(self, username, password):
-        return username if USERS.get(username) == password else None
+        entry = _USER_TABLE.get(username)
+        stored = _DUMMY_PASSWORD if entry is None else entry[0]
+        matches = hmac.compare_digest(stored, password.encode("utf-8"))
+        return username if entry is not None and matches else None
+
+
+# Encoded passwords and User objects are built once, so each login is a single dict lookup
+_USER_TABLE = {
+    username: (
+        password.encode("utf-8"),
+        User(name=username, auth_plugin=CustomAuthPlugin.name),
+    )
+    for username, password in USERS.items()
+}
 
 
 class CustomIdentityProvider(IdentityProvider):
@@ -32,8 +49,12 @@ class CustomIdentityProvider(IdentityProvider):
 
     async def get_user(self, username):
         # Because we're storing users/passwords in an external system (the USERS dictionary, in this case),
-        # we just assume all users exist.
-        return User(name=username, auth_plugin=CustomAuthPlugin.name)
+        # we assume all users exist. Unknown users still go through check(), so they can't be told apart
+        # from a wrong password.
+        entry = _USER_TABLE.get(username)
+        if entry is None:
+            return User(name=username, auth_plugin=CustomAuthPlugin.name)
+        return entry[1]
 
 
 async def main():
@@ -16,20 +16,22 @@ class CustomIdentityProvider(IdentityProvider):
         # Storing passwords in plain text isn't safe.
         # This is done for demonstration purposes.
         # It's better to store the password hash, as returned by `NativePasswordAuthPlugin.create_auth_string`
-        self.passwords = passwords
+        # Hashing up front means logins don't have to re-hash the password every time.
+        self.users = {
+            username: User(
+                name=username,
+                auth_string=NativePasswordAuthPlugin.create_auth_string(password),
+                auth_plugin=NativePasswordAuthPlugin.name,
+            )
+            for username, password in passwords.items()
+            if password
+        }
 
     def get_plugins(self):
         return [NativePasswordAuthPlugin()]
 
     async def get_user(self, username):
-        password = self.passwords.get(username)
-        if password:
-            return User(
-                name=username,
-                auth_string=NativePasswordAuthPlugin.create_auth_string(password),
-                auth_plugin=NativePasswordAuthPlugin.name,
-            )
-        return None
+        return self.users.get(username)
 
 
 async def main():
@@ -1,6 +1,10 @@
 import logging
 import asyncio
 import sqlite3
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlglot import expressions as exp
 
 from mysql_mimic import MysqlServer, Session
 
@@ -10,26 +14,92 @@ logger = logging.getLogger(__name__)
 class DbapiProxySession(Session):
     def __init__(self):
         super().__init__()
-        self.conn = sqlite3.connect(":memory:")
+        # Each session gets a fresh in-memory database that lives as long as the session.
+        # Connections aren't pooled, since a reused in-memory database would carry tables
+        # created by earlier sessions.
+        # sqlite3 keeps a per-connection cache of compiled statements, so repeated queries skip re-parsing.
+        self.conn = sqlite3.connect(
+            ":memory:", check_same_thread=False, cached_statements=256
+        )
+        # Idle cursor reused across queries.
+        # This is None while a query is still streaming rows with it.
+        self._cursor = self.conn.cursor()
+        # Cursor a query is still streaming rows from
+        self._streaming_cursor = None
+        # Column names of recent SELECTs, keyed by SQL.
+        # Kept per session, since each session has its own database.
+        self._column_names = OrderedDict()
+
+    def column_names(self, sql, cursor, maxsize=256):
+        names = self._column_names.get(sql)
+        if names is None:
+            names = [c[0] for c in cursor.description]
+            self._column_names[sql] = names
+            if len(self._column_names) > maxsize:
+                self._column_names.popitem(last=False)
+        else:
+            self._column_names.move_to_end(sql)
+        return names
 
     async def query(self, expression, sql, attrs):
-        cursor = self.conn.cursor()
-        cursor.execute(expression.sql(dialect="sqlite"))
+        cursor = self._cursor or self.conn.cursor()
+        self._cursor = None
+        sqlite_sql = expression.sql(dialect="sqlite")
+        try:
+            # Run blocking database calls in a thread so other connections keep being served
+            await asyncio.get_running_loop().run_in_executor(
+                None, cursor.execute, sqlite_sql
+            )
+        except Exception:
+            self._cursor = cursor
+            raise
+        if cursor.description:
+            self._streaming_cursor = cursor
+            return self.fetch_rows(cursor), self.column_names(sqlite_sql, cursor)
+        # Anything besides plain DML (e.g. CREATE, DROP, ALTER) may have changed the schema
+        if not isinstance(expression, (exp.Insert, exp.Update, exp.Delete)):
+            self._column_names.clear()
+        self._cursor = cursor
+        return None
+
+    async def fetch_rows(self, cursor, batch_size=1000):
+        # Stream rows in batches so large results aren't loaded into memory all at once
+        loop = asyncio.get_running_loop()
         try:
-            rows = cursor.fetchall()
-            if cursor.description:
-                columns = [c[0] for c in cursor.description]
-                return rows, columns
-            return None
+            while True:
+                batch = await loop.run_in_executor(None, cursor.fetchmany, batch_size)
+                if not batch:
+                    break
+                for row in batch:
+                    yield row
         finally:
-            cursor.close()
+            self._streaming_cursor = None
+            self._cursor = cursor
+
+    async def close(self):
+        await super().close()
+        for cursor in (self._cursor, self._streaming_cursor):
+            if cursor:
+                cursor.close()
+        self._cursor = None
+        self._streaming_cursor = None
+        self.conn.close()
 
 
 async def main():
     logging.basicConfig(level=logging.DEBUG)
+    # Blocking database calls run in the default executor.
+    # Size it for the number of blocking database calls we expect at once.
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=64))
     server = MysqlServer(session_factory=DbapiProxySession)
     await server.serve_forever()
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -1,6 +1,7 @@
 import logging
 import asyncio
 from sqlglot.executor import execute
+from sqlglot.schema import MappingSchema
 
 from mysql_mimic import MysqlServer, Session
 
@@ -24,9 +25,13 @@ TABLES = {
 }
 
 
+# Build the SQLGlot schema once, rather than on every call to `execute`
+MAPPING_SCHEMA = MappingSchema(SCHEMA)
+
+
 class MySession(Session):
     async def query(self, expression, sql, attrs):
-        result = execute(expression, schema=SCHEMA, tables=TABLES)
+        result = execute(expression, schema=MAPPING_SCHEMA, tables=TABLES)
         return result.rows, result.columns
 
     async def schema(self):
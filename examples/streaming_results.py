@@ -1,7 +1,7 @@
 import logging
 import asyncio
 
-from mysql_mimic import MysqlServer, Session
+from mysql_mimic import MysqlServer, Session, ResultColumn, ColumnType
 
 
 class MySession(Session):
@@ -13,7 +13,11 @@ class MySession(Session):
             yield i,
 
     async def query(self, expression, sql, attrs):
-        return self.generate_rows(1000), ["a"]
+        # Declaring the column type up front means the server doesn't have to
+        # peek at rows to infer it, and rows are streamed without re-wrapping.
+        return self.generate_rows(1000), [
+            ResultColumn(name="a", type=ColumnType.LONGLONG)
+        ]
 
 
 async def main():
@@ -8,6 +8,7 @@ import time
 
 import k5test
 from sqlglot.executor import execute
+from sqlglot.schema import MappingSchema
 
 from mysql_mimic import (
     MysqlServer,
@@ -39,9 +40,13 @@ TABLES = {
 }
 
 
+# Build the SQLGlot schema once, rather than on every call to `execute`
+MAPPING_SCHEMA = MappingSchema(SCHEMA)
+
+
 class MySession(Session):
     async def query(self, expression, sql, attrs):
-        result = execute(expression, schema=SCHEMA, tables=TABLES)
+        result = execute(expression, schema=MAPPING_SCHEMA, tables=TABLES)
         return result.rows, result.columns
 
     async def schema(self):
@@ -51,49 +56,39 @@ class MySession(Session):
 class CustomIdentityProvider(IdentityProvider):
     def __init__(self, krb5_service, krb5_realm):
         self.users = {
-            "user": {"auth_plugin": "mysql_native_password", "password": "password"},
-            "krb5_user": {"auth_plugin": "authentication_kerberos"},
+            "user": User(
+                name="user",
+                auth_string=NativePasswordAuthPlugin.create_auth_string("password"),
+                auth_plugin=NativePasswordAuthPlugin.name,
+            ),
+            "krb5_user": User(name="krb5_user", auth_plugin=KerberosAuthPlugin.name),
         }
-        self.krb5_service = krb5_service
-        self.krb5_realm = krb5_realm
-
-    def get_plugins(self):
-        return [
+        self.plugins = [
             NativePasswordAuthPlugin(),
-            KerberosAuthPlugin(service=self.krb5_service, realm=self.krb5_realm),
+            KerberosAuthPlugin(service=krb5_service, realm=krb5_realm),
         ]
 
+    def get_plugins(self):
+        return self.plugins
+
     async def get_user(self, username):
-        user = self.users.get(username)
-        if user is not None:
-            auth_plugin = user["auth_plugin"]
-
-            if auth_plugin == "mysql_native_password":
-                password = user.get("password")
-                return User(
-                    name=username,
-                    auth_string=(
-                        NativePasswordAuthPlugin.create_auth_string(password)
-                        if password
-                        else None
-                    ),
-                    auth_plugin=NativePasswordAuthPlugin.name,
-                )
-            elif auth_plugin == "authentication_kerberos":
-                return User(name=username, auth_plugin=KerberosAuthPlugin.name)
-        return None
+        return self.users.get(username)
 
 
 async def wait_for_port(port, host="localhost", timeout=5.0):
     start_time = time.time()
+    delay = 0.001
     while True:
         try:
-            _ = await asyncio.open_connection(host, port)
-            break
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            await writer.wait_closed()
+            return
         except OSError:
-            await asyncio.sleep(0.01)
             if time.time() - start_time >= timeout:
                 raise TimeoutError()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.1)
 
 
 def setup_krb5(krb5_user):
@@ -114,11 +109,10 @@ MySQLConnectorJ {{
      ticketCache="{realm.env["KRB5CCNAME"]}";
 }};
     """
-    path = tempfile.mktemp()
-    with open(path, "w") as f:
+    with tempfile.NamedTemporaryFile("w", delete=False, suffix=".conf") as f:
         f.write(conf)
 
-    return path
+    return f.name
 
 
 async def main():
@@ -1,13 +1,49 @@
 """Implementation of the mysql server wire protocol"""
 
-from mysql_mimic.auth import (
-    User,
-    IdentityProvider,
-    NativePasswordAuthPlugin,
-    NoLoginAuthPlugin,
-    AuthPlugin,
-)
-from mysql_mimic.results import AllowedResult, ResultColumn, ResultSet
-from mysql_mimic.session import Session
-from mysql_mimic.server import MysqlServer
-from mysql_mimic.types import ColumnType
+# Public names are imported lazily (PEP 562), so importing the package doesn't
+# pull in sqlglot, asyncio, ssl, etc. until they're actually needed.
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from mysql_mimic.auth import (
+        User,
+        IdentityProvider,
+        NativePasswordAuthPlugin,
+        NoLoginAuthPlugin,
+        AuthPlugin,
+    )
+    from mysql_mimic.results import AllowedResult, ResultColumn, ResultSet
+    from mysql_mimic.session import Session
+    from mysql_mimic.server import MysqlServer
+    from mysql_mimic.types import ColumnType
+
+_EXPORTS = {
+    "User": "mysql_mimic.auth",
+    "IdentityProvider": "mysql_mimic.auth",
+    "NativePasswordAuthPlugin": "mysql_mimic.auth",
+    "NoLoginAuthPlugin": "mysql_mimic.auth",
+    "AuthPlugin": "mysql_mimic.auth",
+    "AllowedResult": "mysql_mimic.results",
+    "ResultColumn": "mysql_mimic.results",
+    "ResultSet": "mysql_mimic.results",
+    "Session": "mysql_mimic.session",
+    "MysqlServer": "mysql_mimic.server",
+    "ColumnType": "mysql_mimic.types",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    # Cache so __getattr__ isn't hit again for this name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,13 +1,11 @@
 from __future__ import annotations
 
-import io
-from copy import copy
+import hmac
 from hashlib import sha1
 import logging
 from dataclasses import dataclass
 from typing import Optional, Dict, AsyncGenerator, Union, Tuple, Sequence
 
-from mysql_mimic.types import read_str_null
 from mysql_mimic import utils
 
 logger = logging.getLogger(__name__)
@@ -24,6 +22,8 @@ class Forbidden:
 
 @dataclass
 class Success:
+    __slots__ = ("authenticated_as",)
+
     authenticated_as: str
 
 
@@ -40,6 +40,18 @@ class User:
 
 @dataclass
 class AuthInfo:
+    # Declared by hand, since dataclass(slots=True) needs Python 3.10.
+    # Classes with field defaults can't use __slots__ this way.
+    __slots__ = (
+        "username",
+        "data",
+        "user",
+        "connect_attrs",
+        "client_plugin_name",
+        "handshake_auth_data",
+        "handshake_plugin_name",
+    )
+
     username: str
     data: bytes
     user: User
@@ -49,9 +61,15 @@ class AuthInfo:
     handshake_plugin_name: str
 
     def copy(self, data: bytes) -> AuthInfo:
-        new = copy(self)
-        new.data = data
-        return new
+        return AuthInfo(
+            username=self.username,
+            data=data,
+            user=self.user,
+            connect_attrs=self.connect_attrs,
+            client_plugin_name=self.client_plugin_name,
+            handshake_auth_data=self.handshake_auth_data,
+            handshake_plugin_name=self.handshake_plugin_name,
+        )
 
 
 Decision = Union[Success, Forbidden, bytes]
@@ -98,8 +116,9 @@ class AbstractClearPasswordAuthPlugin(AuthPlugin):
         if not auth_info:
             auth_info = yield FILLER
 
-        r = io.BytesIO(auth_info.data)
-        password = read_str_null(r).decode()
+        data = auth_info.data
+        end = data.find(b"\x00")
+        password = (data if end < 0 else data[:end]).decode()
         authenticated_as = await self.check(auth_info.username, password)
         if authenticated_as is not None:
             yield Success(authenticated_as)
@@ -165,7 +184,9 @@ class NativePasswordAuthPlugin(AuthPlugin):
             sha1_sha1_password = bytes.fromhex(auth_string or "")
             sha1_sha1_with_nonce = sha1(nonce + sha1_sha1_password).digest()
             rcvd_sha1_password = utils.xor(scramble, sha1_sha1_with_nonce)
-            return sha1(rcvd_sha1_password).digest() == sha1_sha1_password
+            return hmac.compare_digest(
+                sha1(rcvd_sha1_password).digest(), sha1_sha1_password
+            )
         except Exception:  # pylint: disable=broad-except
             logger.info("Invalid scramble")
             return False
@@ -240,8 +261,14 @@ class IdentityProvider:
 
     An identity provider tells the server with authentication plugins to make
     available to clients and how to retrieve users.
+
+    `get_plugins` is read once, the first time a plugin is looked up, and the
+    result is reused by `get_default_plugin` and `get_plugin` from then on.
     """
 
+    _plugins: Sequence[AuthPlugin]
+    _plugins_by_name: Dict[str, AuthPlugin]
+
     def get_plugins(self) -> Sequence[AuthPlugin]:
         return [NativePasswordAuthPlugin(), NoLoginAuthPlugin()]
 
@@ -249,13 +276,21 @@ class IdentityProvider:
         return None
 
     def get_default_plugin(self) -> AuthPlugin:
-        return self.get_plugins()[0]
+        return self._cached_plugins()[0]
 
     def get_plugin(self, name: str) -> Optional[AuthPlugin]:
+        self._cached_plugins()
+        return self._plugins_by_name.get(name)
+
+    def _cached_plugins(self) -> Sequence[AuthPlugin]:
         try:
-            return next(p for p in self.get_plugins() if p.name == name)
-        except StopIteration:
-            return None
+            return self._plugins
+        except AttributeError:
+            plugins = list(self.get_plugins())
+            # Reversed, so the first plugin with a given name wins.
+            self._plugins_by_name = {p.name: p for p in reversed(plugins)}
+            self._plugins = plugins
+            return plugins
 
 
 class SimpleIdentityProvider(IdentityProvider):
@@ -45,15 +45,17 @@ class CharacterSet(IntEnum):
     gb18030 = 248
     utf8mb4 = 255
 
+    # Precomputed for each member at the bottom of this module
+    _codec: str
+    _default_collation: Collation
+
     @property
     def codec(self) -> str:
-        if self.name == "utf8mb4":
-            return "utf8"
-        return self.name
+        return self._codec
 
     @property
     def default_collation(self) -> Collation:
-        return DEFAULT_COLLATIONS[self]
+        return self._default_collation
 
     def decode(self, b: bytes) -> str:
         return b.decode(self.codec)
@@ -287,239 +289,26 @@ class Collation(IntEnum):
     gb18030_unicode_520_ci = 250
     utf8mb4_0900_ai_ci = 255
 
+    # Precomputed for each member at the bottom of this module
+    _codec: str
+    _charset: CharacterSet
+
     @property
     def codec(self) -> str:
-        return self.charset.codec
+        return self._codec
 
     @property
     def charset(self) -> CharacterSet:
-        return DEFAULT_CHARACTER_SETS[self]
+        return self._charset
 
 
+# Plain dict lookup, skipping EnumMeta.__getitem__ on the connection hot path
+CHARACTER_SETS_BY_NAME = dict(CharacterSet.__members__)
+
+# Every collation name is prefixed with the name of its character set
 DEFAULT_CHARACTER_SETS = {
-    Collation.big5_chinese_ci: CharacterSet.big5,
-    Collation.latin2_czech_cs: CharacterSet.latin2,
-    Collation.dec8_swedish_ci: CharacterSet.dec8,
-    Collation.cp850_general_ci: CharacterSet.cp850,
-    Collation.latin1_german1_ci: CharacterSet.latin1,
-    Collation.hp8_english_ci: CharacterSet.hp8,
-    Collation.koi8r_general_ci: CharacterSet.koi8r,
-    Collation.latin1_swedish_ci: CharacterSet.latin1,
-    Collation.latin2_general_ci: CharacterSet.latin2,
-    Collation.swe7_swedish_ci: CharacterSet.swe7,
-    Collation.ascii_general_ci: CharacterSet.ascii,
-    Collation.ujis_japanese_ci: CharacterSet.ujis,
-    Collation.sjis_japanese_ci: CharacterSet.sjis,
-    Collation.cp1251_bulgarian_ci: CharacterSet.cp1251,
-    Collation.latin1_danish_ci: CharacterSet.latin1,
-    Collation.hebrew_general_ci: CharacterSet.hebrew,
-    Collation.tis620_thai_ci: CharacterSet.tis620,
-    Collation.euckr_korean_ci: CharacterSet.euckr,
-    Collation.latin7_estonian_cs: CharacterSet.latin7,
-    Collation.latin2_hungarian_ci: CharacterSet.latin2,
-    Collation.koi8u_general_ci: CharacterSet.koi8u,
-    Collation.cp1251_ukrainian_ci: CharacterSet.cp1251,
-    Collation.gb2312_chinese_ci: CharacterSet.gb2312,
-    Collation.greek_general_ci: CharacterSet.greek,
-    Collation.cp1250_general_ci: CharacterSet.cp1250,
-    Collation.latin2_croatian_ci: CharacterSet.latin2,
-    Collation.gbk_chinese_ci: CharacterSet.gbk,
-    Collation.cp1257_lithuanian_ci: CharacterSet.cp1257,
-    Collation.latin5_turkish_ci: CharacterSet.latin5,
-    Collation.latin1_german2_ci: CharacterSet.latin1,
-    Collation.armscii8_general_ci: CharacterSet.armscii8,
-    Collation.utf8_general_ci: CharacterSet.utf8,
-    Collation.cp1250_czech_cs: CharacterSet.cp1250,
-    Collation.ucs2_general_ci: CharacterSet.ucs2,
-    Collation.cp866_general_ci: CharacterSet.cp866,
-    Collation.keybcs2_general_ci: CharacterSet.keybcs2,
-    Collation.macce_general_ci: CharacterSet.macce,
-    Collation.macroman_general_ci: CharacterSet.macroman,
-    Collation.cp852_general_ci: CharacterSet.cp852,
-    Collation.latin7_general_ci: CharacterSet.latin7,
-    Collation.latin7_general_cs: CharacterSet.latin7,
-    Collation.macce_bin: CharacterSet.macce,
-    Collation.cp1250_croatian_ci: CharacterSet.cp1250,
-    Collation.utf8mb4_general_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_bin: CharacterSet.utf8mb4,
-    Collation.latin1_bin: CharacterSet.latin1,
-    Collation.latin1_general_ci: CharacterSet.latin1,
-    Collation.latin1_general_cs: CharacterSet.latin1,
-    Collation.cp1251_bin: CharacterSet.cp1251,
-    Collation.cp1251_general_ci: CharacterSet.cp1251,
-    Collation.cp1251_general_cs: CharacterSet.cp1251,
-    Collation.macroman_bin: CharacterSet.macroman,
-    Collation.utf16_general_ci: CharacterSet.utf16,
-    Collation.utf16_bin: CharacterSet.utf16,
-    Collation.utf16le_general_ci: CharacterSet.utf16le,
-    Collation.cp1256_general_ci: CharacterSet.cp1256,
-    Collation.cp1257_bin: CharacterSet.cp1257,
-    Collation.cp1257_general_ci: CharacterSet.cp1257,
-    Collation.utf32_general_ci: CharacterSet.utf32,
-    Collation.utf32_bin: CharacterSet.utf32,
-    Collation.utf16le_bin: CharacterSet.utf16le,
-    Collation.binary: CharacterSet.binary,
-    Collation.armscii8_bin: CharacterSet.armscii8,
-    Collation.ascii_bin: CharacterSet.ascii,
-    Collation.cp1250_bin: CharacterSet.cp1250,
-    Collation.cp1256_bin: CharacterSet.cp1256,
-    Collation.cp866_bin: CharacterSet.cp866,
-    Collation.dec8_bin: CharacterSet.dec8,
-    Collation.greek_bin: CharacterSet.greek,
-    Collation.hebrew_bin: CharacterSet.hebrew,
-    Collation.hp8_bin: CharacterSet.hp8,
-    Collation.keybcs2_bin: CharacterSet.keybcs2,
-    Collation.koi8r_bin: CharacterSet.koi8r,
-    Collation.koi8u_bin: CharacterSet.koi8u,
-    Collation.latin2_bin: CharacterSet.latin2,
-    Collation.latin5_bin: CharacterSet.latin5,
-    Collation.latin7_bin: CharacterSet.latin7,
-    Collation.cp850_bin: CharacterSet.cp850,
-    Collation.cp852_bin: CharacterSet.cp852,
-    Collation.swe7_bin: CharacterSet.swe7,
-    Collation.utf8_bin: CharacterSet.utf8,
-    Collation.big5_bin: CharacterSet.big5,
-    Collation.euckr_bin: CharacterSet.euckr,
-    Collation.gb2312_bin: CharacterSet.gb2312,
-    Collation.gbk_bin: CharacterSet.gbk,
-    Collation.sjis_bin: CharacterSet.sjis,
-    Collation.tis620_bin: CharacterSet.tis620,
-    Collation.ucs2_bin: CharacterSet.ucs2,
-    Collation.ujis_bin: CharacterSet.ujis,
-    Collation.geostd8_general_ci: CharacterSet.geostd8,
-    Collation.geostd8_bin: CharacterSet.geostd8,
-    Collation.latin1_spanish_ci: CharacterSet.latin1,
-    Collation.cp932_japanese_ci: CharacterSet.cp932,
-    Collation.cp932_bin: CharacterSet.cp932,
-    Collation.eucjpms_japanese_ci: CharacterSet.eucjpms,
-    Collation.eucjpms_bin: CharacterSet.eucjpms,
-    Collation.cp1250_polish_ci: CharacterSet.cp1250,
-    Collation.utf16_unicode_ci: CharacterSet.utf16,
-    Collation.utf16_icelandic_ci: CharacterSet.utf16,
-    Collation.utf16_latvian_ci: CharacterSet.utf16,
-    Collation.utf16_romanian_ci: CharacterSet.utf16,
-    Collation.utf16_slovenian_ci: CharacterSet.utf16,
-    Collation.utf16_polish_ci: CharacterSet.utf16,
-    Collation.utf16_estonian_ci: CharacterSet.utf16,
-    Collation.utf16_spanish_ci: CharacterSet.utf16,
-    Collation.utf16_swedish_ci: CharacterSet.utf16,
-    Collation.utf16_turkish_ci: CharacterSet.utf16,
-    Collation.utf16_czech_ci: CharacterSet.utf16,
-    Collation.utf16_danish_ci: CharacterSet.utf16,
-    Collation.utf16_lithuanian_ci: CharacterSet.utf16,
-    Collation.utf16_slovak_ci: CharacterSet.utf16,
-    Collation.utf16_spanish2_ci: CharacterSet.utf16,
-    Collation.utf16_roman_ci: CharacterSet.utf16,
-    Collation.utf16_persian_ci: CharacterSet.utf16,
-    Collation.utf16_esperanto_ci: CharacterSet.utf16,
-    Collation.utf16_hungarian_ci: CharacterSet.utf16,
-    Collation.utf16_sinhala_ci: CharacterSet.utf16,
-    Collation.utf16_german2_ci: CharacterSet.utf16,
-    Collation.utf16_croatian_ci: CharacterSet.utf16,
-    Collation.utf16_unicode_520_ci: CharacterSet.utf16,
-    Collation.utf16_vietnamese_ci: CharacterSet.utf16,
-    Collation.ucs2_unicode_ci: CharacterSet.ucs2,
-    Collation.ucs2_icelandic_ci: CharacterSet.ucs2,
-    Collation.ucs2_latvian_ci: CharacterSet.ucs2,
-    Collation.ucs2_romanian_ci: CharacterSet.ucs2,
-    Collation.ucs2_slovenian_ci: CharacterSet.ucs2,
-    Collation.ucs2_polish_ci: CharacterSet.ucs2,
-    Collation.ucs2_estonian_ci: CharacterSet.ucs2,
-    Collation.ucs2_spanish_ci: CharacterSet.ucs2,
-    Collation.ucs2_swedish_ci: CharacterSet.ucs2,
-    Collation.ucs2_turkish_ci: CharacterSet.ucs2,
-    Collation.ucs2_czech_ci: CharacterSet.ucs2,
-    Collation.ucs2_danish_ci: CharacterSet.ucs2,
-    Collation.ucs2_lithuanian_ci: CharacterSet.ucs2,
-    Collation.ucs2_slovak_ci: CharacterSet.ucs2,
-    Collation.ucs2_spanish2_ci: CharacterSet.ucs2,
-    Collation.ucs2_roman_ci: CharacterSet.ucs2,
-    Collation.ucs2_persian_ci: CharacterSet.ucs2,
-    Collation.ucs2_esperanto_ci: CharacterSet.ucs2,
-    Collation.ucs2_hungarian_ci: CharacterSet.ucs2,
-    Collation.ucs2_sinhala_ci: CharacterSet.ucs2,
-    Collation.ucs2_german2_ci: CharacterSet.ucs2,
-    Collation.ucs2_croatian_ci: CharacterSet.ucs2,
-    Collation.ucs2_unicode_520_ci: CharacterSet.ucs2,
-    Collation.ucs2_vietnamese_ci: CharacterSet.ucs2,
-    Collation.ucs2_general_mysql500_ci: CharacterSet.ucs2,
-    Collation.utf32_unicode_ci: CharacterSet.utf32,
-    Collation.utf32_icelandic_ci: CharacterSet.utf32,
-    Collation.utf32_latvian_ci: CharacterSet.utf32,
-    Collation.utf32_romanian_ci: CharacterSet.utf32,
-    Collation.utf32_slovenian_ci: CharacterSet.utf32,
-    Collation.utf32_polish_ci: CharacterSet.utf32,
-    Collation.utf32_estonian_ci: CharacterSet.utf32,
-    Collation.utf32_spanish_ci: CharacterSet.utf32,
-    Collation.utf32_swedish_ci: CharacterSet.utf32,
-    Collation.utf32_turkish_ci: CharacterSet.utf32,
-    Collation.utf32_czech_ci: CharacterSet.utf32,
-    Collation.utf32_danish_ci: CharacterSet.utf32,
-    Collation.utf32_lithuanian_ci: CharacterSet.utf32,
-    Collation.utf32_slovak_ci: CharacterSet.utf32,
-    Collation.utf32_spanish2_ci: CharacterSet.utf32,
-    Collation.utf32_roman_ci: CharacterSet.utf32,
-    Collation.utf32_persian_ci: CharacterSet.utf32,
-    Collation.utf32_esperanto_ci: CharacterSet.utf32,
-    Collation.utf32_hungarian_ci: CharacterSet.utf32,
-    Collation.utf32_sinhala_ci: CharacterSet.utf32,
-    Collation.utf32_german2_ci: CharacterSet.utf32,
-    Collation.utf32_croatian_ci: CharacterSet.utf32,
-    Collation.utf32_unicode_520_ci: CharacterSet.utf32,
-    Collation.utf32_vietnamese_ci: CharacterSet.utf32,
-    Collation.utf8_unicode_ci: CharacterSet.utf8,
-    Collation.utf8_icelandic_ci: CharacterSet.utf8,
-    Collation.utf8_latvian_ci: CharacterSet.utf8,
-    Collation.utf8_romanian_ci: CharacterSet.utf8,
-    Collation.utf8_slovenian_ci: CharacterSet.utf8,
-    Collation.utf8_polish_ci: CharacterSet.utf8,
-    Collation.utf8_estonian_ci: CharacterSet.utf8,
-    Collation.utf8_spanish_ci: CharacterSet.utf8,
-    Collation.utf8_swedish_ci: CharacterSet.utf8,
-    Collation.utf8_turkish_ci: CharacterSet.utf8,
-    Collation.utf8_czech_ci: CharacterSet.utf8,
-    Collation.utf8_danish_ci: CharacterSet.utf8,
-    Collation.utf8_lithuanian_ci: CharacterSet.utf8,
-    Collation.utf8_slovak_ci: CharacterSet.utf8,
-    Collation.utf8_spanish2_ci: CharacterSet.utf8,
-    Collation.utf8_roman_ci: CharacterSet.utf8,
-    Collation.utf8_persian_ci: CharacterSet.utf8,
-    Collation.utf8_esperanto_ci: CharacterSet.utf8,
-    Collation.utf8_hungarian_ci: CharacterSet.utf8,
-    Collation.utf8_sinhala_ci: CharacterSet.utf8,
-    Collation.utf8_german2_ci: CharacterSet.utf8,
-    Collation.utf8_croatian_ci: CharacterSet.utf8,
-    Collation.utf8_unicode_520_ci: CharacterSet.utf8,
-    Collation.utf8_vietnamese_ci: CharacterSet.utf8,
-    Collation.utf8_general_mysql500_ci: CharacterSet.utf8,
-    Collation.utf8mb4_unicode_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_icelandic_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_latvian_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_romanian_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_slovenian_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_polish_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_estonian_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_spanish_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_swedish_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_turkish_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_czech_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_danish_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_lithuanian_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_slovak_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_spanish2_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_roman_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_persian_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_esperanto_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_hungarian_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_sinhala_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_german2_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_croatian_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_unicode_520_ci: CharacterSet.utf8mb4,
-    Collation.utf8mb4_vietnamese_ci: CharacterSet.utf8mb4,
-    Collation.gb18030_chinese_ci: CharacterSet.gb18030,
-    Collation.gb18030_bin: CharacterSet.gb18030,
-    Collation.gb18030_unicode_520_ci: CharacterSet.gb18030,
-    Collation.utf8mb4_0900_ai_ci: CharacterSet.utf8mb4,
+    collation: CHARACTER_SETS_BY_NAME[collation.name.split("_", 1)[0]]
+    for collation in Collation
 }
 DEFAULT_COLLATIONS = {
     CharacterSet.big5: Collation.big5_chinese_ci,
@@ -564,3 +353,21 @@ DEFAULT_COLLATIONS = {
     CharacterSet.eucjpms: Collation.eucjpms_japanese_ci,
     CharacterSet.gb18030: Collation.gb18030_chinese_ci,
 }
+
+
+# Python codecs for character sets whose names aren't valid codec names.
+# latin1 maps every byte to the code point of the same value, so binary data
+# round trips unchanged.
+_CODECS = {
+    CharacterSet.utf8mb4: "utf8",
+    CharacterSet.binary: "latin1",
+}
+
+# These are read on every encode/decode, so resolve them once per member
+# pylint: disable=protected-access
+for _charset in CharacterSet:
+    _charset._codec = _CODECS.get(_charset, _charset.name)
+    _charset._default_collation = DEFAULT_COLLATIONS[_charset]
+for _collation in Collation:
+    _collation._charset = DEFAULT_CHARACTER_SETS[_collation]
+    _collation._codec = _collation._charset._codec
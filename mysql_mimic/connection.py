@@ -1,7 +1,16 @@
 import asyncio
 import logging
 from ssl import SSLContext
-from typing import Optional, Dict, Any, Iterator, AsyncIterator
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    Iterator,
+    AsyncIterator,
+    AsyncGenerator,
+    Callable,
+    Awaitable,
+)
 
 from mysql_mimic.auth import (
     AuthInfo,
@@ -11,7 +20,7 @@ from mysql_mimic.auth import (
     AuthState,
     IdentityProvider,
 )
-from mysql_mimic.charset import CharacterSet
+from mysql_mimic.charset import CharacterSet, CHARACTER_SETS_BY_NAME
 from mysql_mimic.constants import DEFAULT_SERVER_CAPABILITIES, KillKind
 from mysql_mimic.control import Control
 from mysql_mimic.errors import ErrorCode, MysqlError
@@ -21,7 +30,7 @@ from mysql_mimic.packets import (
     parse_com_field_list,
     make_column_definition_41,
 )
-from mysql_mimic.prepared import PreparedStatement, REGEX_PARAM
+from mysql_mimic.prepared import PreparedStatement, find_params
 from mysql_mimic.results import ensure_result_set, ResultSet
 from mysql_mimic import types, packets, context
 from mysql_mimic.schema import com_field_list_to_show_statement
@@ -32,6 +41,9 @@ from mysql_mimic.utils import seq, aiterate, cooperative_iterate
 
 logger = logging.getLogger(__name__)
 
+# Plain int so checking every packet skips the enum attribute lookup
+_COM_QUIT = int(types.Commands.COM_QUIT)
+
 
 class Connection:
     _MAX_PREPARED_STMT_ID = 2**32
@@ -61,6 +73,8 @@ class Connection:
             self.server_capabilities |= Capabilities.CLIENT_SSL
 
         self.capabilities = Capabilities(0)
+        # Checked for every result set, so resolved once when capabilities are set
+        self._deprecate_eof = False
         self.status_flags = types.ServerStatus(0)
 
         self.max_packet_size = 0
@@ -68,6 +82,23 @@ class Connection:
         self.client_connect_attrs: Dict[str, str] = {}
         self.zstd_compression_level = 0
 
+        # COM_QUIT is handled separately in command_phase since it ends the loop
+        self._command_handlers: Dict[int, Callable[[bytes], Awaitable[None]]] = {
+            types.Commands.COM_QUERY: self.handle_query,
+            types.Commands.COM_STMT_PREPARE: self.handle_stmt_prepare,
+            types.Commands.COM_STMT_SEND_LONG_DATA: self.handle_stmt_send_long_data,
+            types.Commands.COM_STMT_EXECUTE: self.handle_stmt_execute,
+            types.Commands.COM_STMT_FETCH: self.handle_stmt_fetch,
+            types.Commands.COM_STMT_RESET: self.handle_stmt_reset,
+            types.Commands.COM_STMT_CLOSE: self.handle_stmt_close,
+            types.Commands.COM_PING: self.handle_ping,
+            types.Commands.COM_CHANGE_USER: self.handle_change_user,
+            types.Commands.COM_RESET_CONNECTION: self.handle_reset_connection,
+            types.Commands.COM_DEBUG: self.handle_debug,
+            types.Commands.COM_INIT_DB: self.handle_init_db,
+            types.Commands.COM_FIELD_LIST: self.handle_field_list,
+        }
+
         self.prepared_stmt_seq = seq(self._MAX_PREPARED_STMT_ID)
         self.prepared_stmts: Dict[int, PreparedStatement] = {}
 
@@ -77,11 +108,15 @@ class Connection:
 
     @property
     def server_charset(self) -> CharacterSet:
-        return CharacterSet[self.session.variables.get("character_set_results")]
+        return CHARACTER_SETS_BY_NAME[
+            self.session.variables.get("character_set_results")
+        ]
 
     @property
     def client_charset(self) -> CharacterSet:
-        return CharacterSet[self.session.variables.get("character_set_client")]
+        return CHARACTER_SETS_BY_NAME[
+            self.session.variables.get("character_set_client")
+        ]
 
     async def start(self) -> None:
         self._task = asyncio.create_task(self._start())
@@ -114,7 +149,11 @@ class Connection:
             else:
                 raise
         finally:
-            await self.session.close()
+            try:
+                for stmt in self.prepared_stmts.values():
+                    await stmt.close_cursor()
+            finally:
+                await self.session.close()
 
     def kill(self, kind: KillKind = KillKind.CONNECTION) -> None:
         if self._task:
@@ -151,6 +190,7 @@ class Connection:
             )
 
         self.capabilities = response.capabilities
+        self._deprecate_eof = Capabilities.CLIENT_DEPRECATE_EOF in self.capabilities
         self.max_packet_size = response.max_packet_size
         self.session.variables.set("character_set_client", response.client_charset.name)
         self.session.database = response.database
@@ -295,41 +335,16 @@ class Connection:
                 return
             try:
                 command = data[0]
-                rest = data[1:]
-
-                if command == types.Commands.COM_QUERY:
-                    await self.handle_query(rest)
-                elif command == types.Commands.COM_STMT_PREPARE:
-                    await self.handle_stmt_prepare(rest)
-                elif command == types.Commands.COM_STMT_SEND_LONG_DATA:
-                    await self.handle_stmt_send_long_data(rest)
-                elif command == types.Commands.COM_STMT_EXECUTE:
-                    await self.handle_stmt_execute(rest)
-                elif command == types.Commands.COM_STMT_FETCH:
-                    await self.handle_stmt_fetch(rest)
-                elif command == types.Commands.COM_STMT_RESET:
-                    await self.handle_stmt_reset(rest)
-                elif command == types.Commands.COM_STMT_CLOSE:
-                    await self.handle_stmt_close(rest)
-                elif command == types.Commands.COM_PING:
-                    await self.handle_ping(rest)
-                elif command == types.Commands.COM_CHANGE_USER:
-                    await self.handle_change_user(rest)
-                elif command == types.Commands.COM_RESET_CONNECTION:
-                    await self.handle_reset_connection(rest)
-                elif command == types.Commands.COM_DEBUG:
-                    await self.handle_debug(rest)
-                elif command == types.Commands.COM_QUIT:
+                if command == _COM_QUIT:
                     return
-                elif command == types.Commands.COM_INIT_DB:
-                    await self.handle_init_db(rest)
-                elif command == types.Commands.COM_FIELD_LIST:
-                    await self.handle_field_list(rest)
-                else:
+
+                handler = self._command_handlers.get(command)
+                if handler is None:
                     raise MysqlError(
                         f"Unsupported Command: {hex(command)}",
                         ErrorCode.UNKNOWN_COM_ERROR,
                     )
+                await handler(data[1:])
 
             except MysqlError as e:
                 logger.error(e)
@@ -393,19 +408,23 @@ class Connection:
         com_field_list = parse_com_field_list(self.client_charset, data)
         sql = com_field_list_to_show_statement(com_field_list)
         result = await self.query(sql=sql, query_attrs={})
+        rows = result.rows
+        if not isinstance(rows, (list, tuple)):
+            rows = [row async for row in aiterate(rows)]
+        server_charset = self.server_charset
         columns = b"".join(
             [
                 make_column_definition_41(
-                    server_charset=self.server_charset,
+                    server_charset=server_charset,
                     table=com_field_list.table,
                     name=row[0],
                     is_com_field_list=True,
                     default=row[4],
                 )
-                async for row in aiterate(result.rows)
+                for row in rows
             ]
         )
-        await self.stream.write(columns)
+        await self.stream.write(columns, drain=False)
         await self.stream.write(self.ok_or_eof())
 
     async def handle_query(self, data: bytes) -> None:
@@ -440,12 +459,13 @@ class Connection:
         sql = self.client_charset.decode(data)
 
         stmt_id = next(self.prepared_stmt_seq)
-        num_params = len(REGEX_PARAM.findall(sql))
+        param_offsets = find_params(sql)
 
         stmt = PreparedStatement(
             stmt_id=stmt_id,
             sql=sql,
-            num_params=num_params,
+            num_params=len(param_offsets),
+            param_offsets=param_offsets,
         )
         self.prepared_stmts[stmt_id] = stmt
 
@@ -491,7 +511,8 @@ class Connection:
             await self.stream.write(self.ok())
             return
 
-        await self.stream.write(types.uint_len(len(result_set.columns)))
+        # Packets are buffered by the stream and flushed by the final write
+        await self.stream.write(types.uint_len(len(result_set.columns)), drain=False)
 
         for column in result_set.columns:
             await self.stream.write(
@@ -500,25 +521,41 @@ class Connection:
                     name=column.name,
                     column_type=column.type,
                     character_set=column.character_set,
-                )
+                ),
+                drain=False,
             )
 
-        async def gen_rows() -> AsyncIterator[bytes]:
-            async for r in cooperative_iterate(aiterate(result_set.rows)):
-                yield packets.make_binary_resultrow(r, result_set.columns)
+        async def gen_rows() -> AsyncGenerator[bytes, None]:
+            if isinstance(result_set.rows, (list, tuple)):
+                # Lists are walked in place rather than through cooperative_iterate,
+                # which would add an async generator step per row
+                for i, r in enumerate(result_set.rows):
+                    if i != 0 and i % 10_000 == 0:
+                        await asyncio.sleep(0)
+                    yield packets.make_binary_resultrow(r, result_set.columns)
+            else:
+                # Closing the cursor closes this generator, which in turn has to
+                # close the session's rows so their cleanup runs now
+                source = cooperative_iterate(result_set.rows)
+                try:
+                    async for r in source:
+                        yield packets.make_binary_resultrow(r, result_set.columns)
+                finally:
+                    await source.aclose()
 
         rows = gen_rows()
 
         if com_stmt_execute.use_cursor:
+            await com_stmt_execute.stmt.close_cursor()
             com_stmt_execute.stmt.cursor = rows
             await self.stream.write(
                 self.ok_or_eof(flags=types.ServerStatus.SERVER_STATUS_CURSOR_EXISTS)
             )
         else:
             if not self.deprecate_eof():
-                await self.stream.write(self.eof())
+                await self.stream.write(self.eof(), drain=False)
             async for row in rows:
-                await self.stream.write(row)
+                await self.stream.write(row, drain=False)
             await self.stream.write(self.ok_or_eof())
 
     async def handle_stmt_fetch(self, data: bytes) -> None:
@@ -532,15 +569,20 @@ class Connection:
         stmt = self.get_stmt(com_stmt_fetch.stmt_id)
         assert stmt.cursor is not None
         count = 0
+        done = False
 
-        async for packet in cooperative_iterate(stmt.cursor):
-            if count >= com_stmt_fetch.num_rows:
+        # Pull exactly num_rows so no row is consumed without being sent.
+        # The cursor already yields to the event loop periodically.
+        while count < com_stmt_fetch.num_rows:
+            try:
+                # anext() is only available in python >=3.10
+                # pylint: disable-next=unnecessary-dunder-call
+                packet = await stmt.cursor.__anext__()
+            except StopAsyncIteration:
+                done = True
                 break
             await self.stream.write(packet, drain=False)
             count += 1
-        await self.stream.drain()
-
-        done = count < com_stmt_fetch.num_rows
 
         await self.stream.write(
             self.ok_or_eof(
@@ -562,7 +604,7 @@ class Connection:
         com_stmt_reset = packets.parse_com_stmt_reset(data)
         stmt = self.get_stmt(com_stmt_reset.stmt_id)
         stmt.param_buffers = None
-        stmt.cursor = None
+        await stmt.close_cursor()
         await self.session.reset()
         await self.stream.write(self.ok())
 
@@ -573,12 +615,17 @@ class Connection:
         COM_STMT_CLOSE deallocates a prepared statement.
         """
         com_stmt_close = packets.parse_com_stmt_close(data)
-        self.prepared_stmts.pop(com_stmt_close.stmt_id, None)
+        stmt = self.prepared_stmts.pop(com_stmt_close.stmt_id, None)
+        if stmt is not None:
+            await stmt.close_cursor()
 
     def get_stmt(self, stmt_id: int) -> PreparedStatement:
-        if stmt_id in self.prepared_stmts:
-            return self.prepared_stmts[stmt_id]
-        raise MysqlError(f"Unknown statement: {stmt_id}", ErrorCode.UNKNOWN_PROCEDURE)
+        stmt = self.prepared_stmts.get(stmt_id)
+        if stmt is None:
+            raise MysqlError(
+                f"Unknown statement: {stmt_id}", ErrorCode.UNKNOWN_PROCEDURE
+            )
+        return stmt
 
     async def query(self, sql: str, query_attrs: Dict[str, str]) -> ResultSet:
         logger.debug("Received query: %s", sql)
@@ -625,7 +672,7 @@ class Connection:
         )
 
     def deprecate_eof(self) -> bool:
-        return Capabilities.CLIENT_DEPRECATE_EOF in self.capabilities
+        return self._deprecate_eof
 
     async def text_resultset(self, result_set: ResultSet) -> AsyncIterator[bytes]:
         yield packets.make_column_count(
@@ -645,9 +692,17 @@ class Connection:
 
         affected_rows = 0
 
-        async for row in cooperative_iterate(aiterate(result_set.rows)):
-            affected_rows += 1
-            yield packets.make_text_resultset_row(row, result_set.columns)
+        if isinstance(result_set.rows, (list, tuple)):
+            # Same fast path as gen_rows in handle_stmt_execute
+            for row in result_set.rows:
+                if affected_rows != 0 and affected_rows % 10_000 == 0:
+                    await asyncio.sleep(0)
+                affected_rows += 1
+                yield packets.make_text_resultset_row(row, result_set.columns)
+        else:
+            async for row in cooperative_iterate(result_set.rows):
+                affected_rows += 1
+                yield packets.make_text_resultset_row(row, result_set.columns)
 
         yield self.ok_or_eof(affected_rows=affected_rows)
 
@@ -42,26 +42,24 @@ def value_to_expression(value: Any) -> exp.Expression:
     return exp.Literal.string(str(value))
 
 
+# Bare keywords allowed as variable values
+KEYWORD_VALUES = {"DEFAULT": DEFAULT, "ON": True, "OFF": False}
+
+
 def expression_to_value(expression: exp.Expression) -> Any:
-    if expression == exp.true():
-        return True
-    if expression == exp.false():
-        return False
-    if expression == exp.null():
+    if isinstance(expression, exp.Boolean):
+        return expression.this
+    if isinstance(expression, exp.Null):
         return None
-    if isinstance(expression, exp.Literal) and not expression.args.get("is_string"):
-        try:
-            return int(expression.this)
-        except ValueError:
-            return float(expression.this)
     if isinstance(expression, exp.Literal):
-        return expression.name
-    if expression.name == "DEFAULT":
-        return DEFAULT
-    if expression.name == "ON":
-        return True
-    if expression.name == "OFF":
-        return False
+        if expression.args.get("is_string"):
+            return expression.name
+        number = expression.this
+        if number.lstrip("-").isdigit():
+            return int(number)
+        return float(number)
+    if expression.name in KEYWORD_VALUES:
+        return KEYWORD_VALUES[expression.name]
     raise MysqlError(
         "Complex expressions in variables not supported yet",
         code=ErrorCode.NOT_SUPPORTED_YET,
@@ -1,11 +1,16 @@
 import io
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, Dict, Any, Sequence, Callable, Tuple, List, Union
 
 from mysql_mimic.charset import Collation, CharacterSet
 from mysql_mimic.constants import DEFAULT_SERVER_CAPABILITIES
 from mysql_mimic.errors import ErrorCode, get_sqlstate, MysqlError
-from mysql_mimic.prepared import PreparedStatement, REGEX_PARAM
+from mysql_mimic.prepared import (
+    PreparedStatement,
+    find_params,
+    interpolate_params,
+)
 from mysql_mimic.results import NullBitmap, ResultColumn
 from mysql_mimic.types import (
     Capabilities,
@@ -114,6 +119,8 @@ class ComFieldList:
     wildcard: str
 
 
+# OK/EOF packets are sent after nearly every command with mostly the same values
+@lru_cache(maxsize=256)
 def make_ok(
     capabilities: Capabilities,
     status_flags: ServerStatus,
@@ -129,15 +136,19 @@ def make_ok(
         uint_len(last_insert_id),
     ]
 
+    # Combine flags as plain ints - bitwise ops on IntFlag members are comparatively slow
+    status = int(status_flags) | int(flags)
+
     if Capabilities.CLIENT_PROTOCOL_41 in capabilities:
-        parts.append(uint_2(status_flags | flags))
+        parts.append(uint_2(status))
         parts.append(uint_2(warnings))
     elif Capabilities.CLIENT_TRANSACTIONS in capabilities:
-        parts.append(uint_2(status_flags | flags))
+        parts.append(uint_2(status))
 
     return _concat(*parts)
 
 
+@lru_cache(maxsize=256)
 def make_eof(
     capabilities: Capabilities,
     status_flags: ServerStatus,
@@ -148,7 +159,7 @@ def make_eof(
 
     if Capabilities.CLIENT_PROTOCOL_41 in capabilities:
         parts.append(uint_2(warnings))
-        parts.append(uint_2(status_flags | flags))
+        parts.append(uint_2(int(status_flags) | int(flags)))
 
     return _concat(*parts)
 
@@ -338,6 +349,8 @@ def make_column_count(capabilities: Capabilities, column_count: int) -> bytes:
 
 
 # pylint: disable=too-many-arguments
+# Result sets usually repeat the same columns query after query
+@lru_cache(maxsize=4096)
 def make_column_definition_41(
     server_charset: CharacterSet,
     schema: Optional[str] = None,
@@ -385,16 +398,12 @@ def make_column_definition_41(
 def make_text_resultset_row(
     row: Sequence[Any], columns: Sequence[ResultColumn]
 ) -> bytes:
-    parts = []
-
-    for value, column in zip(row, columns):
-        if value is None:
-            parts.append(b"\xfb")
-        else:
-            text = column.text_encode(value)
-            parts.append(str_len(text))
-
-    return _concat(*parts)
+    return b"".join(
+        [
+            b"\xfb" if value is None else str_len(column.text_encode(value))
+            for value, column in zip(row, columns)
+        ]
+    )
 
 
 def make_com_stmt_prepare_ok(statement: PreparedStatement) -> bytes:
@@ -529,8 +538,15 @@ def _interpolate_params(
             capabilities, client_charset, reader, parameter_count, stmt.param_buffers
         )
 
-        for _, value in params[: stmt.num_params]:
-            sql = REGEX_PARAM.sub(_encode_param_as_sql(value), sql, 1)
+        if stmt.num_params:
+            offsets = stmt.param_offsets
+            if offsets is None:
+                offsets = find_params(sql)
+            sql = interpolate_params(
+                sql,
+                offsets,
+                [_encode_param_as_sql(v) for _, v in params[: stmt.num_params]],
+            )
 
         query_attrs = {k: v for k, v in params[stmt.num_params :] if k is not None}
 
@@ -1,9 +1,61 @@
 import re
 from dataclasses import dataclass
-from typing import Optional, Dict, AsyncIterable
+from typing import Optional, Dict, AsyncGenerator, List, Sequence
 
-# Borrowed from mysql-connector-python
-REGEX_PARAM = re.compile(r"""\?(?=(?:[^"'`]*["'`][^"'`]*["'`])*[^"'`]*$)""")
+# Parameter placeholders, the quote characters that can hide them, backslash escapes,
+# and the start of comments (MySQL requires whitespace after `--`)
+_PARAM_TOKENS = re.compile(r"""[?'"`\\#]|--(?=\s|$)|/\*""")
+
+
+def find_params(sql: str) -> List[int]:
+    """
+    Find the offsets of `?` parameter placeholders in a SQL statement.
+
+    This is a single left-to-right scan that tracks whether we're inside a quoted
+    string or identifier, so placeholders in quotes are skipped. Inside strings,
+    the character after a backslash is escaped, as in MySQL's default SQL mode.
+    Comments are skipped as well.
+    """
+    offsets = []
+    quote = None
+    skip_to = 0
+    for match in _PARAM_TOKENS.finditer(sql):
+        start = match.start()
+        if start < skip_to:
+            continue
+        token = match.group()
+        if quote:
+            if token == quote:
+                quote = None
+            elif token == "\\" and quote != "`":
+                skip_to = start + 2
+        elif token == "?":
+            offsets.append(start)
+        elif token == "/*":
+            end = sql.find("*/", start + 2)
+            if end < 0:
+                break
+            skip_to = end + 2
+        elif token in ("--", "#"):
+            end = sql.find("\n", start)
+            if end < 0:
+                break
+            skip_to = end + 1
+        elif token != "\\":
+            quote = token
+    return offsets
+
+
+def interpolate_params(sql: str, offsets: Sequence[int], values: Sequence[str]) -> str:
+    """Replace the placeholders at `offsets` with `values`"""
+    parts = []
+    start = 0
+    for offset, value in zip(offsets, values):
+        parts.append(sql[start:offset])
+        parts.append(value)
+        start = offset + 1
+    parts.append(sql[start:])
+    return "".join(parts)
 
 
 @dataclass
@@ -12,4 +64,11 @@ class PreparedStatement:
     sql: str
     num_params: int
     param_buffers: Optional[Dict[int, bytearray]] = None
-    cursor: Optional[AsyncIterable[bytes]] = None
+    cursor: Optional[AsyncGenerator[bytes, None]] = None
+    param_offsets: Optional[List[int]] = None
+
+    async def close_cursor(self) -> None:
+        """Close the open cursor, if any, releasing its rows now rather than at GC"""
+        if self.cursor is not None:
+            cursor, self.cursor = self.cursor, None
+            await cursor.aclose()
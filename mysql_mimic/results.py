@@ -13,6 +13,7 @@ from typing import (
     Union,
     Tuple,
     Dict,
+    List,
     AsyncIterable,
     cast,
 )
@@ -117,33 +118,41 @@ async def _ensure_result_cols(
     # Copy the columns
     columns = list(columns)
 
-    arows = aiterate(rows)
+    # Sequences can be scanned in place and passed through as they are, which
+    # lets the connection iterate them without async generator overhead.
+    if isinstance(rows, (list, tuple)):
+        for peek in rows:
+            if not remaining:
+                break
+            _infer_columns(peek, remaining, columns)
+    else:
+        arows = aiterate(rows)
+
+        # Keep track of rows we've consumed from the iterator so we can add them back
+        peeks = []
 
-    # Keep track of rows we've consumed from the iterator so we can add them back
-    peeks = []
+        # Find the first non-null value for each column
+        while remaining:
+            try:
+                peek = await arows.__anext__()
+            except StopAsyncIteration:
+                break
 
-    # Find the first non-null value for each column
-    while remaining:
-        try:
-            peek = await arows.__anext__()
-        except StopAsyncIteration:
-            break
+            peeks.append(peek)
+            _infer_columns(peek, remaining, columns)
 
-        peeks.append(peek)
+        # Add the consumed rows back in to the iterator
+        async def gen_rows() -> AsyncIterable[Sequence[Any]]:
+            try:
+                for row in peeks:
+                    yield row
 
-        inferred = []
-        for name, i in remaining.items():
-            value = peek[i]
-            if value is not None:
-                type_ = infer_type(value)
-                columns[i] = ResultColumn(
-                    name=str(name),
-                    type=type_,
-                )
-                inferred.append(name)
+                async for row in arows:
+                    yield row
+            finally:
+                await arows.aclose()
 
-        for name in inferred:
-            remaining.pop(name)
+        rows = gen_rows()
 
     # If we failed to find a non-null value, set the type to NULL
     for name, i in remaining.items():
@@ -152,16 +161,27 @@ async def _ensure_result_cols(
             type=ColumnType.NULL,
         )
 
-    # Add the consumed rows back in to the iterator
-    async def gen_rows() -> AsyncIterable[Sequence[Any]]:
-        for row in peeks:
-            yield row
+    assert all(isinstance(col, ResultColumn) for col in columns)
+    return ResultSet(rows=rows, columns=cast(Sequence[ResultColumn], columns))
 
-        async for row in arows:
-            yield row
 
-    assert all(isinstance(col, ResultColumn) for col in columns)
-    return ResultSet(rows=gen_rows(), columns=cast(Sequence[ResultColumn], columns))
+def _infer_columns(
+    peek: Sequence[Any], remaining: Dict[Any, int], columns: List[Any]
+) -> None:
+    """Infer the type of any remaining columns that are non-null in `peek`"""
+    inferred = []
+    for name, i in remaining.items():
+        value = peek[i]
+        if value is not None:
+            type_ = infer_type(value)
+            columns[i] = ResultColumn(
+                name=str(name),
+                type=type_,
+            )
+            inferred.append(name)
+
+    for name in inferred:
+        remaining.pop(name)
 
 
 def _binary_encode_tiny(col: ResultColumn, val: Any) -> bytes:
@@ -4,7 +4,8 @@ import re
 from collections import defaultdict
 from itertools import chain
 from dataclasses import dataclass
-from typing import Any, Optional, List, Dict, Iterable
+from functools import lru_cache
+from typing import Any, Optional, List, Dict, Iterable, Tuple
 
 from sqlglot.executor import Table, execute
 from sqlglot import expressions as exp
@@ -62,6 +63,12 @@ def mapping_to_columns(schema: dict) -> List[Column]:
     return result
 
 
+@lru_cache(maxsize=None)
+def _info_schema_columns() -> Tuple[Column, ...]:
+    # INFORMATION_SCHEMA's own columns never change
+    return tuple(mapping_to_columns(INFO_SCHEMA))
+
+
 def info_schema_tables(columns: Iterable[Column]) -> Dict[str, Dict[str, Table]]:
     """
     Convert a list of Column instances into a mapping of SQLGlot Tables.
@@ -77,18 +84,15 @@ def info_schema_tables(columns: Iterable[Column]) -> Dict[str, Dict[str, Table]]
 
     tables = set()
     dbs = set()
-    catalogs = set()
 
-    info_schema_cols = mapping_to_columns(INFO_SCHEMA)
-
-    for column in chain(columns, info_schema_cols):
-        tables.add((column.catalog, column.schema, column.table))
-        dbs.add((column.catalog, column.schema))
-        catalogs.add(column.catalog)
+    columns_table = data["information_schema"]["columns"]
+    for column in chain(columns, _info_schema_columns()):
         key = (column.catalog, column.schema, column.table)
+        tables.add(key)
+        dbs.add((column.catalog, column.schema))
         ordinal_position = ordinal_positions[key]
-        ordinal_positions[key] += 1
-        data["information_schema"]["columns"].append(
+        ordinal_positions[key] = ordinal_position + 1
+        columns_table.append(
             (
                 column.catalog,  # table_catalog
                 column.schema,  # table_schema
@@ -115,8 +119,9 @@ def info_schema_tables(columns: Iterable[Column]) -> Dict[str, Dict[str, Table]]
             )
         )
 
+    tables_table = data["information_schema"]["tables"]
     for catalog, db, table in sorted(tables):
-        data["information_schema"]["tables"].append(
+        tables_table.append(
             (
                 catalog,  # table_catalog
                 db,  # table_schema
@@ -142,8 +147,9 @@ def info_schema_tables(columns: Iterable[Column]) -> Dict[str, Dict[str, Table]]
             )
         )
 
+    schemata_table = data["information_schema"]["schemata"]
     for catalog, db in sorted(dbs):
-        data["information_schema"]["schemata"].append(
+        schemata_table.append(
             (
                 catalog,  # catalog_name
                 db,  # schema_name
@@ -156,27 +162,58 @@ def info_schema_tables(columns: Iterable[Column]) -> Dict[str, Dict[str, Table]]
     return data
 
 
+_SHOW_COLUMNS_OUTPUTS = (
+    'column_name AS "Field"',
+    'data_type AS "Type"',
+    'is_nullable AS "Null"',
+    'column_key AS "Key"',
+    'column_default AS "Default"',
+    'extra AS "Extra"',
+)
+_SHOW_FULL_COLUMNS_OUTPUTS = _SHOW_COLUMNS_OUTPUTS + (
+    'collation_name AS "Collation"',
+    'privileges AS "Privileges"',
+    'column_comment AS "Comment"',
+)
+_SHOW_TABLES_OUTPUTS = ('table_name AS "Table_name"',)
+_SHOW_FULL_TABLES_OUTPUTS = _SHOW_TABLES_OUTPUTS + ('table_type AS "Table_type"',)
+_SHOW_DATABASES_OUTPUTS = ('schema_name AS "Database"',)
+_SHOW_INDEX_OUTPUTS = (
+    '"table_name" AS Table',
+    '"non_unique" AS Non_unique',
+    '"index_name" AS Key_name',
+    '"seq_in_index" AS Seq_in_index',
+    '"column_name" AS Column_name',
+    '"collation" AS Collation',
+    '"cardinality" AS Cardinality',
+    '"sub_part" AS Sub_part',
+    '"packed" AS Packed',
+    '"nullable" AS Null',
+    '"index_type" AS Index_type',
+    '"comment" AS Comment',
+    '"index_comment" AS Index_comment',
+    '"is_visible" AS Visible',
+    '"expression" AS Expression',
+)
+
+
+@lru_cache(maxsize=None)
+def _parse_outputs(outputs: Tuple[str, ...]) -> Tuple[exp.Expression, ...]:
+    # Parsed once per SHOW variant.
+    # exp.select copies the expressions it's given, so these are never mutated.
+    return tuple(exp.maybe_parse(output) for output in outputs)
+
+
 def show_statement_to_info_schema_query(
     show: exp.Show, database: Optional[str] = None
 ) -> exp.Select:
     kind = show.name.upper()
     if kind == "COLUMNS":
-        outputs = [
-            'column_name AS "Field"',
-            'data_type AS "Type"',
-            'is_nullable AS "Null"',
-            'column_key AS "Key"',
-            'column_default AS "Default"',
-            'extra AS "Extra"',
-        ]
-        if show.args.get("full"):
-            outputs.extend(
-                [
-                    'collation_name AS "Collation"',
-                    'privileges AS "Privileges"',
-                    'column_comment AS "Comment"',
-                ]
-            )
+        outputs: Tuple[str, ...] = (
+            _SHOW_FULL_COLUMNS_OUTPUTS
+            if show.args.get("full")
+            else _SHOW_COLUMNS_OUTPUTS
+        )
         table = show.text("target")
         if not table:
             raise MysqlError(
@@ -184,7 +221,7 @@ def show_statement_to_info_schema_query(
                 code=ErrorCode.PARSE_ERROR,
             )
         select = (
-            exp.select(*outputs)
+            exp.select(*_parse_outputs(outputs))
             .from_("information_schema.columns")
             .where(f"table_name = '{table}'")
         )
@@ -195,11 +232,11 @@ def show_statement_to_info_schema_query(
         if like:
             select = select.where(f"column_name LIKE '{like}'")
     elif kind == "TABLES":
-        outputs = ['table_name AS "Table_name"']
-        if show.args.get("full"):
-            outputs.extend(['table_type AS "Table_type"'])
+        outputs = (
+            _SHOW_FULL_TABLES_OUTPUTS if show.args.get("full") else _SHOW_TABLES_OUTPUTS
+        )
 
-        select = exp.select(*outputs).from_("information_schema.tables")
+        select = exp.select(*_parse_outputs(outputs)).from_("information_schema.tables")
         db = show.text("db") or database
         if not db:
             raise MysqlError("No database selected.", code=ErrorCode.NO_DB_ERROR)
@@ -208,30 +245,13 @@ def show_statement_to_info_schema_query(
         if like:
             select = select.where(f"table_name LIKE '{like}'")
     elif kind == "DATABASES":
-        select = exp.select('schema_name AS "Database"').from_(
+        select = exp.select(*_parse_outputs(_SHOW_DATABASES_OUTPUTS)).from_(
             "information_schema.schemata"
         )
         like = show.text("like")
         if like:
             select = select.where(f"schema_name LIKE '{like}'")
     elif kind == "INDEX":
-        outputs = [
-            '"table_name" AS Table',
-            '"non_unique" AS Non_unique',
-            '"index_name" AS Key_name',
-            '"seq_in_index" AS Seq_in_index',
-            '"column_name" AS Column_name',
-            '"collation" AS Collation',
-            '"cardinality" AS Cardinality',
-            '"sub_part" AS Sub_part',
-            '"packed" AS Packed',
-            '"nullable" AS Null',
-            '"index_type" AS Index_type',
-            '"comment" AS Comment',
-            '"index_comment" AS Index_comment',
-            '"is_visible" AS Visible',
-            '"expression" AS Expression',
-        ]
         table = show.text("target")
         if not table:
             raise MysqlError(
@@ -239,7 +259,7 @@ def show_statement_to_info_schema_query(
                 code=ErrorCode.PARSE_ERROR,
             )
         select = (
-            exp.select(*outputs)
+            exp.select(*_parse_outputs(_SHOW_INDEX_OUTPUTS))
             .from_("information_schema.statistics")
             .where(f"table_name = '{table}'")
         )
@@ -264,10 +284,23 @@ def com_field_list_to_show_statement(com_field_list: ComFieldList) -> str:
     return show.sql(dialect="mysql")
 
 
+# Escaped characters (e.g. `\_`), wildcards, and runs of literal characters
+_LIKE_TOKEN = re.compile(r"\\.|[%_]|[^%_\\]+|\\")
+_LIKE_WILDCARDS = {"%": ".*?", "_": "."}
+
+
+def _like_token_to_regex(match: re.Match) -> str:
+    token = match.group()
+    if len(token) == 2 and token[0] == "\\":
+        # `\x` matches a literal `x`, including `\%` and `\_`
+        return re.escape(token[1])
+    return _LIKE_WILDCARDS.get(token) or re.escape(token)
+
+
+@lru_cache(maxsize=256)
 def like_to_regex(like: str) -> re.Pattern:
-    like = like.replace("%", ".*?")
-    like = like.replace("_", ".")
-    return re.compile(like)
+    # Translate wildcards and escapes, and escape everything else, in a single pass
+    return re.compile(_LIKE_TOKEN.sub(_like_token_to_regex, like))
 
 
 class BaseInfoSchema:
@@ -49,6 +49,12 @@ if TYPE_CHECKING:
 
 Middleware = Callable[["Query"], Awaitable[AllowedResult]]
 
+# SELECT args that make a query non-static, e.g. anything with a FROM or WHERE clause.
+# Static queries include the "SELECT @@version_comment LIMIT 1" sent by the mysql CLI on connect.
+_NON_STATIC_SELECT_ARGS = tuple(
+    set(exp.Select.arg_types) - {"expressions", "limit", "hint"}
+)
+
 
 @dataclass
 class Query:
@@ -59,8 +65,9 @@ class Query:
         expression: current query expression
         sql: the original SQL sent by the client
         attrs: query attributes
-        _middlewares: subsequent middleware functions
+        _middlewares: all middleware functions
         _query: the ultimate query method
+        _index: position of the next middleware to call
     """
 
     expression: exp.Expression
@@ -68,6 +75,7 @@ class Query:
     attrs: Dict[str, str]
     _middlewares: list[Middleware]
     _query: Callable[[exp.Expression, str, dict[str, str]], Awaitable[AllowedResult]]
+    _index: int = 0
 
     async def next(self) -> AllowedResult:
         """
@@ -76,16 +84,18 @@ class Query:
         Returns:
             The final query result.
         """
-        if not self._middlewares:
+        index = self._index
+        if index >= len(self._middlewares):
             return await self._query(self.expression, self.sql, self.attrs)
         q = Query(
             expression=self.expression,
             sql=self.sql,
             attrs=self.attrs,
-            _middlewares=self._middlewares[1:],
+            _middlewares=self._middlewares,
             _query=self._query,
+            _index=index + 1,
         )
-        return await self._middlewares[0](q)
+        return await self._middlewares[index](q)
 
     async def start(self) -> AllowedResult:
         """
@@ -93,7 +103,7 @@ class Query:
 
         This should only be called by the framework code
         """
-        return await self._middlewares[0](self)
+        return await self.next()
 
 
 class BaseSession:
@@ -215,6 +225,20 @@ class Session(BaseSession):
             "CURRENT_DATE",
         }
 
+        # SET and SHOW statement handlers, keyed by kind
+        self._set_handlers: Dict[str, Callable[[exp.SetItem], None]] = {
+            "VARIABLE": self._set_variable,
+            "CHARACTER SET": self._set_charset,
+            "NAMES": self._set_names,
+            "TRANSACTION": self._set_transaction,
+        }
+        self._show_handlers: Dict[str, Callable[[exp.Show], AllowedResult]] = {
+            "VARIABLES": self._show_variables,
+            "STATUS": self._show_status,
+            "WARNINGS": self._show_warnings,
+            "ERRORS": self._show_errors,
+        }
+
         # Current database
         self.database = None
 
@@ -312,9 +336,11 @@ class Session(BaseSession):
 
     async def _set_var_middleware(self, q: Query) -> AllowedResult:
         """Handles any SET_VAR hints, which set system variables for a single statement"""
-        hints = q.expression.find_all(exp.Hint)
-        if not hints:
+        # Optimizer hints can only come from a /*+ ... */ comment, so most
+        # statements can skip walking the AST
+        if "/*+" not in q.sql:
             return await q.next()
+        hints = q.expression.find_all(exp.Hint)
 
         assignments = {}
 
@@ -378,15 +404,9 @@ class Session(BaseSession):
         return await q.next()
 
     async def _show(self, expression: exp.Show) -> AllowedResult:
-        kind = expression.name.upper()
-        if kind == "VARIABLES":
-            return self._show_variables(expression)
-        if kind == "STATUS":
-            return self._show_status(expression)
-        if kind == "WARNINGS":
-            return self._show_warnings(expression)
-        if kind == "ERRORS":
-            return self._show_errors(expression)
+        handler = self._show_handlers.get(expression.name.upper())
+        if handler:
+            return handler(expression)
         select = show_statement_to_info_schema_query(expression, self.database)
         return await self._query_info_schema(select)
 
@@ -421,6 +441,13 @@ class Session(BaseSession):
 
     async def _replace_variables_middleware(self, q: Query) -> AllowedResult:
         """Replace session variables and information functions with their corresponding values"""
+        if not self._may_have_variables(q.sql):
+            return await q.next()
+
+        # Bound once here, since _transform runs for every node in the AST
+        functions = self._functions
+        constants = self._constants
+        variables = self.variables
 
         def _transform(node: exp.Expression) -> exp.Expression:
             new_node = None
@@ -430,15 +457,20 @@ class Session(BaseSession):
                     func_name = node.name.upper()
                 else:
                     func_name = node.sql_name()
-                func = self._functions.get(func_name)
+                func = functions.get(func_name)
                 if func:
                     value = func()
                     new_node = value_to_expression(value)
-            elif isinstance(node, exp.Column) and node.sql() in self._constants:
-                value = self._functions[node.sql()]()
+            elif (
+                isinstance(node, exp.Column)
+                # Cheap check on the name before generating SQL for the column
+                and node.name in constants
+                and node.sql() in constants
+            ):
+                value = functions[node.name]()
                 new_node = value_to_expression(value)
             elif isinstance(node, exp.SessionParameter):
-                value = self.variables.get(node.name)
+                value = variables.get(node.name)
                 new_node = value_to_expression(value)
 
             if (
@@ -464,6 +496,18 @@ class Session(BaseSession):
 
         return await q.next()
 
+    def _may_have_variables(self, sql: str) -> bool:
+        """
+        Cheap check on the raw SQL for anything _replace_variables_middleware might replace.
+
+        This lets most queries skip transforming the whole AST.
+        """
+        if "@@" in sql or "(" in sql:
+            return True
+        # Some information functions, e.g. CURRENT_USER, don't need parentheses
+        upper = sql.upper()
+        return any(name in upper for name in self._functions)
+
     async def _static_query_middleware(self, q: Query) -> AllowedResult:
         """
         Handle static queries (e.g. SELECT 1).
@@ -471,8 +515,7 @@ class Session(BaseSession):
         These very common, as many clients execute commands like SELECT DATABASE() when connecting.
         """
         if isinstance(q.expression, exp.Select) and not any(
-            q.expression.args.get(a)
-            for a in set(exp.Select.arg_types) - {"expressions", "limit", "hint"}
+            q.expression.args.get(a) for a in _NON_STATIC_SELECT_ARGS
         ):
             result = execute(q.expression)
             return result.rows, result.columns
@@ -486,31 +529,30 @@ class Session(BaseSession):
                 assert isinstance(item, exp.SetItem)
 
                 kind = setitem_kind(item)
-
-                if kind == "VARIABLE":
-                    self._set_variable(item)
-                elif kind == "CHARACTER SET":
-                    self._set_charset(item)
-                elif kind == "NAMES":
-                    self._set_names(item)
-                elif kind == "TRANSACTION":
-                    self._set_transaction(item)
-                else:
+                handler = self._set_handlers.get(kind)
+                if not handler:
                     raise MysqlError(
                         f"Unsupported SET statement: {kind}",
                         code=ErrorCode.NOT_SUPPORTED_YET,
                     )
+                handler(item)
 
             return [], []
         return await q.next()
 
     async def _info_schema_middleware(self, q: Query) -> AllowedResult:
         """Intercept queries to INFORMATION_SCHEMA tables"""
-        dbs = find_dbs(q.expression)
-        if (self.database and self.database.lower() in INFO_SCHEMA) or (
-            dbs and all(db.lower() in INFO_SCHEMA for db in dbs)
-        ):
+        if self.database and self.database.lower() in INFO_SCHEMA:
             return await self._query_info_schema(q.expression)
+        # Resolving scopes is expensive.
+        # Only do it if some table is qualified with an INFORMATION_SCHEMA database.
+        if any(
+            table.text("db").lower() in INFO_SCHEMA
+            for table in q.expression.find_all(exp.Table)
+        ):
+            dbs = find_dbs(q.expression)
+            if dbs and all(db.lower() in INFO_SCHEMA for db in dbs):
+                return await self._query_info_schema(q.expression)
         return await q.next()
 
     def _set_variable(self, setitem: exp.SetItem) -> None:
@@ -577,10 +619,16 @@ class Session(BaseSession):
             self.variables.set(variable, value)
 
     def _show_variables(self, show: exp.Show) -> AllowedResult:
-        rows = [(k, None if v is None else str(v)) for k, v in self.variables.list()]
+        # Filter names before looking up any values
+        names = sorted(self.variables.schema)
         like = show.text("like")
         if like:
-            rows = [(k, v) for k, v in rows if like_to_regex(like).match(k)]
+            pattern = like_to_regex(like)
+            names = [name for name in names if pattern.match(name)]
+        rows = []
+        for name in names:
+            value = self.variables.get(name)
+            rows.append((name, None if value is None else str(value)))
         return rows, ["Variable_name", "Value"]
 
     def _show_status(self, show: exp.Show) -> AllowedResult:
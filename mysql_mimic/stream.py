@@ -3,9 +3,12 @@ import struct
 from ssl import SSLContext
 
 from mysql_mimic.errors import MysqlError, ErrorCode
-from mysql_mimic.types import uint_3, uint_1
 from mysql_mimic.utils import seq
 
+# Packet header: 3 byte payload length followed by 1 byte sequence ID.
+# Both are packed/unpacked together as a single little-endian uint32.
+_HEADER = struct.Struct("<I")
+
 
 class ConnectionClosed(Exception):
     pass
@@ -32,9 +35,9 @@ class MysqlStream:
             if not header:
                 raise ConnectionClosed()
 
-            i = struct.unpack("<I", header)[0]
+            i = _HEADER.unpack(header)[0]
             payload_length = i & 0x00FFFFFF
-            sequence_id = (i & 0xFF000000) >> 24
+            sequence_id = i >> 24
 
             expected = next(self.seq)
             if sequence_id != expected:
@@ -57,11 +60,8 @@ class MysqlStream:
             payload = data[:0xFFFFFF]
             data = data[0xFFFFFF:]
 
-            payload_length = uint_3(len(payload))
-            sequence_id = uint_1(next(self.seq))
-            packet = payload_length + sequence_id + payload
-
-            self._buffer.extend(packet)
+            self._buffer.extend(_HEADER.pack(len(payload) | (next(self.seq) << 24)))
+            self._buffer.extend(payload)
             if drain or len(self._buffer) >= self._buffer_size:
                 await self.drain()
 
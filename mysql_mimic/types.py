@@ -2,7 +2,7 @@ from __future__ import annotations
 import io
 import struct
 
-from enum import IntEnum, IntFlag, auto
+from enum import IntEnum, IntFlag
 
 
 class ColumnType(IntEnum):
@@ -78,72 +78,72 @@ class Commands(IntEnum):
 
 
 class ColumnDefinition(IntFlag):
-    NOT_NULL_FLAG = auto()
-    PRI_KEY_FLAG = auto()
-    UNIQUE_KEY_FLAG = auto()
-    MULTIPLE_KEY_FLAG = auto()
-    BLOB_FLAG = auto()
-    UNSIGNED_FLAG = auto()
-    ZEROFILL_FLAG = auto()
-    BINARY_FLAG = auto()
-    ENUM_FLAG = auto()
-    AUTO_INCREMENT_FLAG = auto()
-    TIMESTAMP_FLAG = auto()
-    SET_FLAG = auto()
-    NO_DEFAULT_VALUE_FLAG = auto()
-    ON_UPDATE_NOW_FLAG = auto()
-    NUM_FLAG = auto()
-    PART_KEY_FLAG = auto()
-    GROUP_FLAG = auto()
-    UNIQUE_FLAG = auto()
-    BINCMP_FLAG = auto()
-    GET_FIXED_FIELDS_FLAG = auto()
-    FIELD_IN_PART_FUNC_FLAG = auto()
-    FIELD_IN_ADD_INDEX = auto()
-    FIELD_IS_RENAMED = auto()
-    FIELD_FLAGS_STORAGE_MEDIA = auto()
-    FIELD_FLAGS_STORAGE_MEDIA_MASK = auto()
-    FIELD_FLAGS_COLUMN_FORMAT = auto()
-    FIELD_FLAGS_COLUMN_FORMAT_MASK = auto()
-    FIELD_IS_DROPPED = auto()
-    EXPLICIT_NULL_FLAG = auto()
-    NOT_SECONDARY_FLAG = auto()
-    FIELD_IS_INVISIBLE = auto()
+    NOT_NULL_FLAG = 1 << 0
+    PRI_KEY_FLAG = 1 << 1
+    UNIQUE_KEY_FLAG = 1 << 2
+    MULTIPLE_KEY_FLAG = 1 << 3
+    BLOB_FLAG = 1 << 4
+    UNSIGNED_FLAG = 1 << 5
+    ZEROFILL_FLAG = 1 << 6
+    BINARY_FLAG = 1 << 7
+    ENUM_FLAG = 1 << 8
+    AUTO_INCREMENT_FLAG = 1 << 9
+    TIMESTAMP_FLAG = 1 << 10
+    SET_FLAG = 1 << 11
+    NO_DEFAULT_VALUE_FLAG = 1 << 12
+    ON_UPDATE_NOW_FLAG = 1 << 13
+    NUM_FLAG = 1 << 14
+    PART_KEY_FLAG = 1 << 15
+    GROUP_FLAG = 1 << 16
+    UNIQUE_FLAG = 1 << 17
+    BINCMP_FLAG = 1 << 18
+    GET_FIXED_FIELDS_FLAG = 1 << 19
+    FIELD_IN_PART_FUNC_FLAG = 1 << 20
+    FIELD_IN_ADD_INDEX = 1 << 21
+    FIELD_IS_RENAMED = 1 << 22
+    FIELD_FLAGS_STORAGE_MEDIA = 1 << 23
+    FIELD_FLAGS_STORAGE_MEDIA_MASK = 1 << 24
+    FIELD_FLAGS_COLUMN_FORMAT = 1 << 25
+    FIELD_FLAGS_COLUMN_FORMAT_MASK = 1 << 26
+    FIELD_IS_DROPPED = 1 << 27
+    EXPLICIT_NULL_FLAG = 1 << 28
+    NOT_SECONDARY_FLAG = 1 << 29
+    FIELD_IS_INVISIBLE = 1 << 30
 
 
 class Capabilities(IntFlag):
-    CLIENT_LONG_PASSWORD = auto()
-    CLIENT_FOUND_ROWS = auto()
-    CLIENT_LONG_FLAG = auto()
-    CLIENT_CONNECT_WITH_DB = auto()
-    CLIENT_NO_SCHEMA = auto()
-    CLIENT_COMPRESS = auto()
-    CLIENT_ODBC = auto()
-    CLIENT_LOCAL_FILES = auto()
-    CLIENT_IGNORE_SPACE = auto()
-    CLIENT_PROTOCOL_41 = auto()
-    CLIENT_INTERACTIVE = auto()
-    CLIENT_SSL = auto()
-    CLIENT_IGNORE_SIGPIPE = auto()
-    CLIENT_TRANSACTIONS = auto()
-    CLIENT_RESERVED = auto()
-    CLIENT_SECURE_CONNECTION = auto()
-    CLIENT_MULTI_STATEMENTS = auto()
-    CLIENT_MULTI_RESULTS = auto()
-    CLIENT_PS_MULTI_RESULTS = auto()
-    CLIENT_PLUGIN_AUTH = auto()
-    CLIENT_CONNECT_ATTRS = auto()
-    CLIENT_PLUGIN_AUTH_LENENC_CLIENT_DATA = auto()
-    CLIENT_CAN_HANDLE_EXPIRED_PASSWORDS = auto()
-    CLIENT_SESSION_TRACK = auto()
-    CLIENT_DEPRECATE_EOF = auto()
-    CLIENT_OPTIONAL_RESULTSET_METADATA = auto()
-    CLIENT_ZSTD_COMPRESSION_ALGORITHM = auto()
-    CLIENT_QUERY_ATTRIBUTES = auto()
-    MULTI_FACTOR_AUTHENTICATION = auto()
-    CLIENT_CAPABILITY_EXTENSION = auto()
-    CLIENT_SSL_VERIFY_SERVER_CERT = auto()
-    CLIENT_REMEMBER_OPTIONS = auto()
+    CLIENT_LONG_PASSWORD = 1 << 0
+    CLIENT_FOUND_ROWS = 1 << 1
+    CLIENT_LONG_FLAG = 1 << 2
+    CLIENT_CONNECT_WITH_DB = 1 << 3
+    CLIENT_NO_SCHEMA = 1 << 4
+    CLIENT_COMPRESS = 1 << 5
+    CLIENT_ODBC = 1 << 6
+    CLIENT_LOCAL_FILES = 1 << 7
+    CLIENT_IGNORE_SPACE = 1 << 8
+    CLIENT_PROTOCOL_41 = 1 << 9
+    CLIENT_INTERACTIVE = 1 << 10
+    CLIENT_SSL = 1 << 11
+    CLIENT_IGNORE_SIGPIPE = 1 << 12
+    CLIENT_TRANSACTIONS = 1 << 13
+    CLIENT_RESERVED = 1 << 14
+    CLIENT_SECURE_CONNECTION = 1 << 15
+    CLIENT_MULTI_STATEMENTS = 1 << 16
+    CLIENT_MULTI_RESULTS = 1 << 17
+    CLIENT_PS_MULTI_RESULTS = 1 << 18
+    CLIENT_PLUGIN_AUTH = 1 << 19
+    CLIENT_CONNECT_ATTRS = 1 << 20
+    CLIENT_PLUGIN_AUTH_LENENC_CLIENT_DATA = 1 << 21
+    CLIENT_CAN_HANDLE_EXPIRED_PASSWORDS = 1 << 22
+    CLIENT_SESSION_TRACK = 1 << 23
+    CLIENT_DEPRECATE_EOF = 1 << 24
+    CLIENT_OPTIONAL_RESULTSET_METADATA = 1 << 25
+    CLIENT_ZSTD_COMPRESSION_ALGORITHM = 1 << 26
+    CLIENT_QUERY_ATTRIBUTES = 1 << 27
+    MULTI_FACTOR_AUTHENTICATION = 1 << 28
+    CLIENT_CAPABILITY_EXTENSION = 1 << 29
+    CLIENT_SSL_VERIFY_SERVER_CERT = 1 << 30
+    CLIENT_REMEMBER_OPTIONS = 1 << 31
 
 
 class ServerStatus(IntFlag):
@@ -176,120 +176,149 @@ class ComStmtExecuteFlags(IntFlag):
     PARAMETER_COUNT_AVAILABLE = 0x08
 
 
+# Precompiled structs, so formats aren't parsed on every call
+_UINT_1 = struct.Struct("<B")
+_UINT_2 = struct.Struct("<H")
+_UINT_4 = struct.Struct("<I")
+_UINT_8 = struct.Struct("<Q")
+_INT_1 = struct.Struct("<b")
+_INT_2 = struct.Struct("<h")
+_INT_4 = struct.Struct("<i")
+_INT_8 = struct.Struct("<q")
+_FLOAT = struct.Struct("<f")
+_DOUBLE = struct.Struct("<d")
+_UINT_LEN_2 = struct.Struct("<BH")
+_UINT_LEN_3 = struct.Struct("<BL")
+_UINT_LEN_8 = struct.Struct("<BQ")
+
+
+# Length-encoded integers below 251 are a single byte.
+# These are by far the most common, so they are precomputed.
+_UINT_LEN_1 = tuple(bytes([i]) for i in range(251))
+
+
 def uint_len(i: int) -> bytes:
-    if i < 251:
-        return struct.pack("<B", i)
+    if 0 <= i < 251:
+        return _UINT_LEN_1[i]
     if i < 2**16:
-        return struct.pack("<BH", 0xFC, i)
+        return _UINT_LEN_2.pack(0xFC, i)
     if i < 2**24:
-        return struct.pack("<BL", 0xFD, i)[:-1]
+        return _UINT_LEN_3.pack(0xFD, i)[:-1]
 
-    return struct.pack("<BQ", 0xFE, i)
+    return _UINT_LEN_8.pack(0xFE, i)
 
 
 def uint_1(i: int) -> bytes:
-    return struct.pack("<B", i)
+    return _UINT_1.pack(i)
 
 
 def uint_2(i: int) -> bytes:
-    return struct.pack("<H", i)
+    return _UINT_2.pack(i)
 
 
 def uint_3(i: int) -> bytes:
-    return struct.pack("<HB", i & 0xFFFF, i >> 16)
+    try:
+        return i.to_bytes(3, "little")
+    except OverflowError as e:
+        raise struct.error(f"{i} does not fit in 3 bytes") from e
 
 
 def uint_4(i: int) -> bytes:
-    return struct.pack("<I", i)
+    return _UINT_4.pack(i)
 
 
 def uint_6(i: int) -> bytes:
-    return struct.pack("<IH", i & 0xFFFFFFFF, i >> 32)
+    try:
+        return i.to_bytes(6, "little")
+    except OverflowError as e:
+        raise struct.error(f"{i} does not fit in 6 bytes") from e
 
 
 def uint_8(i: int) -> bytes:
-    return struct.pack("<Q", i)
+    return _UINT_8.pack(i)
 
 
 def str_fixed(l: int, s: bytes) -> bytes:
-    return struct.pack(f"<{l}s", s)
+    n = len(s)
+    if n >= l:
+        return s[:l]
+    return s + bytes(l - n)
 
 
 def str_null(s: bytes) -> bytes:
-    l = len(s)
-    return struct.pack(f"<{l}sB", s, 0)
+    return s + b"\x00"
 
 
 def str_len(s: bytes) -> bytes:
-    l = len(s)
-    return uint_len(l) + str_fixed(l, s)
+    return uint_len(len(s)) + s
 
 
 def str_rest(s: bytes) -> bytes:
-    l = len(s)
-    return str_fixed(l, s)
+    return s
 
 
 def read_int_1(reader: io.BytesIO) -> int:
     data = reader.read(1)
-    return struct.unpack("<b", data)[0]
+    return _INT_1.unpack(data)[0]
 
 
 def read_uint_1(reader: io.BytesIO) -> int:
     data = reader.read(1)
-    return struct.unpack("<B", data)[0]
+    return _UINT_1.unpack(data)[0]
 
 
 def read_int_2(reader: io.BytesIO) -> int:
     data = reader.read(2)
-    return struct.unpack("<h", data)[0]
+    return _INT_2.unpack(data)[0]
 
 
 def read_uint_2(reader: io.BytesIO) -> int:
     data = reader.read(2)
-    return struct.unpack("<H", data)[0]
+    return _UINT_2.unpack(data)[0]
 
 
 def read_uint_3(reader: io.BytesIO) -> int:
     data = reader.read(3)
-    t = struct.unpack("<HB", data)
-    return t[0] + (t[1] << 16)
+    if len(data) != 3:
+        raise struct.error("unpack requires a buffer of 3 bytes")
+    return int.from_bytes(data, "little")
 
 
 def read_int_4(reader: io.BytesIO) -> int:
     data = reader.read(4)
-    return struct.unpack("<i", data)[0]
+    return _INT_4.unpack(data)[0]
 
 
 def read_uint_4(reader: io.BytesIO) -> int:
     data = reader.read(4)
-    return struct.unpack("<I", data)[0]
+    return _UINT_4.unpack(data)[0]
 
 
 def read_uint_6(reader: io.BytesIO) -> int:
     data = reader.read(6)
-    t = struct.unpack("<IH", data)
-    return t[0] + (t[1] << 32)
+    if len(data) != 6:
+        raise struct.error("unpack requires a buffer of 6 bytes")
+    return int.from_bytes(data, "little")
 
 
 def read_int_8(reader: io.BytesIO) -> int:
     data = reader.read(8)
-    return struct.unpack("<q", data)[0]
+    return _INT_8.unpack(data)[0]
 
 
 def read_uint_8(reader: io.BytesIO) -> int:
     data = reader.read(8)
-    return struct.unpack("<Q", data)[0]
+    return _UINT_8.unpack(data)[0]
 
 
 def read_float(reader: io.BytesIO) -> float:
     data = reader.read(4)
-    return struct.unpack("<f", data)[0]
+    return _FLOAT.unpack(data)[0]
 
 
 def read_double(reader: io.BytesIO) -> float:
     data = reader.read(8)
-    return struct.unpack("<d", data)[0]
+    return _DOUBLE.unpack(data)[0]
 
 
 def read_uint_len(reader: io.BytesIO) -> int:
@@ -312,12 +341,17 @@ def read_str_fixed(reader: io.BytesIO, l: int) -> bytes:
 
 
 def read_str_null(reader: io.BytesIO) -> bytes:
-    data = b""
-    while True:
-        b = reader.read(1)
-        if b == b"\x00":
-            return data
-        data += b
+    # getvalue doesn't copy a BytesIO that hasn't been written to,
+    # so this scans for the terminator without reading byte by byte.
+    start = reader.tell()
+    buffer = reader.getvalue()
+    end = buffer.find(b"\x00", start)
+    if end < 0:
+        # No terminator - treat the rest of the buffer as the string
+        reader.seek(0, io.SEEK_END)
+        return buffer[start:]
+    reader.seek(end + 1)
+    return buffer[start:end]
 
 
 def read_str_len(reader: io.BytesIO) -> bytes:
@@ -5,7 +5,7 @@ import inspect
 import sys
 from collections.abc import Iterator
 import random
-from typing import List, TypeVar, AsyncIterable, Iterable, AsyncIterator, cast
+from typing import List, TypeVar, AsyncIterable, Iterable, AsyncGenerator, cast
 import string
 
 from sqlglot import expressions as exp
@@ -17,6 +17,9 @@ T = TypeVar("T")
 # MySQL Connector/J uses ASCII to decode nonce
 SAFE_NONCE_CHARS = (string.ascii_letters + string.digits).encode()
 
+# SystemRandom reads from os.urandom and keeps no state, so one instance can be shared
+_SYSTEM_RANDOM = random.SystemRandom()
+
 
 class seq(Iterator):
     """Auto-incrementing sequence with an optional maximum size"""
@@ -46,11 +49,7 @@ def xor(a: bytes, b: bytes) -> bytes:
 
 
 def nonce(nbytes: int) -> bytes:
-    return bytes(
-        bytearray(
-            [random.SystemRandom().choice(SAFE_NONCE_CHARS) for _ in range(nbytes)]
-        )
-    )
+    return bytes([_SYSTEM_RANDOM.choice(SAFE_NONCE_CHARS) for _ in range(nbytes)])
 
 
 def find_tables(expression: exp.Expression) -> List[exp.Table]:
@@ -101,25 +100,50 @@ def dict_depth(d: dict) -> int:
         return 1
 
 
-async def aiterate(iterable: AsyncIterable[T] | Iterable[T]) -> AsyncIterator[T]:
-    """Iterate either an async iterable or a regular iterable"""
+async def aiterate(
+    iterable: AsyncIterable[T] | Iterable[T],
+) -> AsyncGenerator[T, None]:
+    """
+    Iterate either an async iterable or a regular iterable.
+
+    Closing the returned generator early also closes a wrapped async generator.
+    """
     if inspect.isasyncgen(iterable):
-        async for item in iterable:
-            yield item
+        agen = cast(AsyncGenerator[T, None], iterable)
+        try:
+            async for item in agen:
+                yield item
+        finally:
+            await agen.aclose()
     else:
         for item in cast(Iterable, iterable):
             yield item
 
 
 async def cooperative_iterate(
-    iterable: AsyncIterable[T], batch_size: int = 10_000
-) -> AsyncIterator[T]:
+    iterable: AsyncIterable[T] | Iterable[T], batch_size: int = 10_000
+) -> AsyncGenerator[T, None]:
     """
-    Iterate an async iterable in a cooperative manner, yielding control back to the event loop every `batch_size` iterations
+    Iterate an async iterable or a regular iterable in a cooperative manner, yielding control back to the event loop
+    every `batch_size` iterations
+
+    Closing the returned generator early also closes a wrapped async generator.
     """
-    i = 0
-    async for item in iterable:
-        if i != 0 and i % batch_size == 0:
-            await asyncio.sleep(0)
-        yield item
-        i += 1
+    if inspect.isasyncgen(iterable):
+        agen = cast(AsyncGenerator[T, None], iterable)
+        i = 0
+        try:
+            async for item in agen:
+                if i != 0 and i % batch_size == 0:
+                    await asyncio.sleep(0)
+                yield item
+                i += 1
+        finally:
+            await agen.aclose()
+    else:
+        # Regular iterables are iterated directly rather than through aiterate,
+        # saving an async generator step per item
+        for i, item in enumerate(cast(Iterable[T], iterable)):
+            if i != 0 and i % batch_size == 0:
+                await asyncio.sleep(0)
+            yield item
@@ -19,6 +19,9 @@ VariableSchema = Tuple[VariableType, Any, bool]
 
 DEFAULT = Default()
 
+# Sentinel for values that haven't been set, since None is a valid value
+_UNSET = object()
+
 SYSTEM_VARIABLES: dict[str, VariableSchema] = {
     # name: (type, default, dynamic)
     "auto_increment_increment": (int, 1, True),
@@ -90,8 +93,9 @@ class Variables(abc.ABC):
 
     def get(self, name: str) -> Any:
         name = name.lower()
-        if name in self.values:
-            return self.values[name]
+        value = self.values.get(name, _UNSET)
+        if value is not _UNSET:
+            return value
         _, default, _ = self.get_schema(name)
 
         return default
@@ -0,0 +1,14 @@
+from mysql_mimic.charset import CharacterSet, Collation
+
+
+def test_binary() -> None:
+    data = bytes(range(256))
+    assert CharacterSet.binary.encode(CharacterSet.binary.decode(data)) == data
+    assert Collation.binary.charset is CharacterSet.binary
+    assert Collation.binary.codec == CharacterSet.binary.codec
+
+
+def test_utf8mb4() -> None:
+    assert CharacterSet.utf8mb4.encode("🐬") == "🐬".encode("utf-8")
+    assert CharacterSet.utf8mb4.decode("🐬".encode("utf-8")) == "🐬"
+    assert Collation.utf8mb4_0900_ai_ci.charset is CharacterSet.utf8mb4
@@ -0,0 +1,29 @@
+from mysql_mimic.prepared import find_params, interpolate_params
+
+
+def test_find_params() -> None:
+    assert not find_params("SELECT 1")
+    assert find_params("SELECT ?") == [7]
+    assert find_params("SELECT ?, '?', ?") == [7, 15]
+    assert find_params('SELECT "?", `?`, ?') == [17]
+    assert find_params("SELECT 'it''s ?', ?") == [18]
+    assert find_params('SELECT ? FROM x WHERE a = "it\'s"') == [7]
+    assert find_params(r"SELECT 'it\'s ?', ?") == [18]
+    assert find_params(r'SELECT "x\"?", ?') == [15]
+    assert find_params(r"SELECT 'a\\', ?") == [14]
+    assert find_params(r"SELECT `a\`, ?") == [13]
+    assert find_params("SELECT /* don't */ ?") == [19]
+    assert find_params("SELECT /* ? */ ?") == [15]
+    assert not find_params("SELECT /* ?")
+    assert find_params("SELECT 1 -- it's\n, ?") == [19]
+    assert find_params("SELECT 1 # it's ?\n, ?") == [20]
+    assert not find_params("SELECT 1 -- ?")
+    assert find_params("SELECT 1--?") == [10]
+    assert find_params("SELECT '# -- /*', ?") == [18]
+
+
+def test_interpolate_params() -> None:
+    sql = "SELECT ?, '?', ?"
+    offsets = find_params(sql)
+    assert interpolate_params(sql, offsets, ["1", "'a'"]) == "SELECT 1, '?', 'a'"
+    assert interpolate_params("SELECT 1", [], []) == "SELECT 1"
@@ -2,7 +2,17 @@ import asyncio
 import io
 from contextlib import closing
 from datetime import date, datetime, timedelta
-from typing import Any, Callable, Awaitable, Sequence, Dict, List, Tuple, Type
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Awaitable,
+    Sequence,
+    Dict,
+    List,
+    Tuple,
+    Type,
+)
 
 import pytest
 import pytest_asyncio
@@ -18,7 +28,13 @@ from mysql_mimic.charset import CharacterSet
 from mysql_mimic.results import AllowedResult
 from mysql_mimic.constants import INFO_SCHEMA
 from mysql_mimic.types import ColumnType
-from tests.conftest import PreparedDictCursor, query, MockSession, ConnectFixture
+from tests.conftest import (
+    PreparedDictCursor,
+    query,
+    to_thread,
+    MockSession,
+    ConnectFixture,
+)
 from tests.fixtures import queries
 
 QueryFixture = Callable[[str], Awaitable[Sequence[Dict[str, Any]]]]
@@ -700,6 +716,12 @@ async def test_describe_select(
             "SHOW  SESSION  VARIABLES  LIKE 'version_%'",
             [{"Value": "mysql-mimic", "Variable_name": "version_comment"}],
         ),
+        ("SHOW VARIABLES LIKE 'version.%'", []),
+        (
+            r"SHOW VARIABLES LIKE 'version\_comment'",
+            [{"Value": "mysql-mimic", "Variable_name": "version_comment"}],
+        ),
+        (r"SHOW VARIABLES LIKE 'version\%'", []),
         ("show index from x", []),
         (
             "show columns from x like '%'",
@@ -894,6 +916,67 @@ async def test_async_iterator(
     ] == result
 
 
+@pytest.mark.asyncio
+async def test_stmt_fetch(
+    session: MockSession,
+    server: MysqlServer,
+    mysql_connector_conn: MySQLConnectionAbstract,
+) -> None:
+    session.return_value = ([(i,) for i in range(5)], ["a"])
+    conn: Any = mysql_connector_conn
+
+    stmt = await to_thread(conn.cmd_stmt_prepare, b"SELECT a FROM x")
+    stmt_id = stmt["statement_id"]
+    # CURSOR_TYPE_READ_ONLY, so rows are only sent by COM_STMT_FETCH
+    _, columns, _ = await to_thread(conn.cmd_stmt_execute, stmt_id, flags=1)
+
+    rows = []
+    for _ in range(3):
+        await to_thread(conn.cmd_stmt_fetch, stmt_id, 2)
+        batch, _ = await to_thread(conn.get_rows, binary=True, columns=columns)
+        rows.extend(batch)
+
+    assert rows == [(0,), (1,), (2,), (3,), (4,)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("command", ["cmd_stmt_reset", "cmd_stmt_close"])
+async def test_stmt_cursor_closed(
+    session: MockSession,
+    server: MysqlServer,
+    mysql_connector_conn: MySQLConnectionAbstract,
+    command: str,
+) -> None:
+    closed = False
+
+    async def gen_rows() -> AsyncIterator[Tuple[int]]:
+        nonlocal closed
+        try:
+            for i in range(5):
+                yield (i,)
+        finally:
+            closed = True
+
+    # Columns are typed up front, so no rows are consumed before the cursor opens
+    session.return_value = ResultSet(
+        rows=gen_rows(),
+        columns=[ResultColumn(name="a", type=ColumnType.LONGLONG)],
+    )
+    conn: Any = mysql_connector_conn
+
+    stmt = await to_thread(conn.cmd_stmt_prepare, b"SELECT a FROM x")
+    stmt_id = stmt["statement_id"]
+    _, columns, _ = await to_thread(conn.cmd_stmt_execute, stmt_id, flags=1)
+    await to_thread(conn.cmd_stmt_fetch, stmt_id, 2)
+    await to_thread(conn.get_rows, binary=True, columns=columns)
+    assert not closed
+
+    await to_thread(getattr(conn, command), stmt_id)
+    # COM_STMT_CLOSE has no response, so round trip once more before checking
+    await to_thread(conn.cmd_ping)
+    assert closed
+
+
 @pytest.mark.asyncio
 async def test_sqlalchemy_session(
     server: MysqlServer,
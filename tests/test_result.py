@@ -21,6 +21,10 @@ async def gen_rows() -> Any:
             (gen_rows(), ["a", "b", "c"]),
             [ColumnType.LONGLONG, ColumnType.STRING, ColumnType.NULL],
         ),
+        (
+            ([(1, None, None), (None, "2", None)], ["a", "b", "c"]),
+            [ColumnType.LONGLONG, ColumnType.STRING, ColumnType.NULL],
+        ),
     ],
 )
 async def test_ensure_result_set_columns(result: Any, column_types: Any) -> None:
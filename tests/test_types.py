@@ -209,6 +209,8 @@ def test_read_str_null() -> None:
     assert types.read_str_null(reader) == b"kelsin"
     reader = io.BytesIO(b"kelsin\x00foo")
     assert types.read_str_null(reader) == b"kelsin"
+    assert types.read_str_null(reader) == b"foo"
+    assert types.read_str_rest(reader) == b""
 
 
 def test_read_str_len() -> None: